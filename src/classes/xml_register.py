@@ -1,6 +1,14 @@
 from typing import Dict, Any, Optional
 
 class XMLRegister:
+    # One instance per OD index/sub-index; slots drop the per-instance __dict__
+    __slots__ = (
+        'index', 'sub_index', 'name', 'object_type', 'data_type', 'access_type',
+        'pdo_mapping', 'default_value', 'high_value', 'low_value', 'memory_type',
+        'disabled', 'description', 'current_value', 'od_c_length_bytes',
+        'od_c_length_bits', 'size', 'cob_id', 'position', 'pdo_type'
+    )
+
     def __init__(self, index: str, obj_data: Dict[str, Any], sub_index: Optional[str] = None, od_c_length: Optional[int] = None):
         self.index = index.upper() if index else "0000"
         self.sub_index = sub_index.upper() if sub_index else None
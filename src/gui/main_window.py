@@ -67,6 +67,7 @@ class MainWindow(ft.Column):
         
         # Graphs <-> OD Reader bidirectional reference
         self.modules["graphs"].set_od_reader_module(self.modules["od_reader"])
+        self.modules["od_reader"].set_graph_module(self.modules["graphs"])
         
         # Graphs <-> Variables reference
         self.modules["graphs"].set_variables_module(self.modules["variables"])
@@ -99,6 +100,11 @@ class MainWindow(ft.Column):
             """Handle tab changes and cross-module communication"""
             selected_tab = e.control.selected_index
             
+            # Parse the saved OD file the first time a tab that uses OD data is opened;
+            # dependent modules are notified when the background load completes
+            if selected_tab in (1, 2, 6, 7):  # Monitor, Variables, OD Reader, Graphs
+                self.modules["od_reader"].ensure_loaded(update=False)
+            
             # Auto-load OD data when switching to monitor tab
             if selected_tab == 1:  # Monitor tab
                 try:
@@ -120,6 +126,9 @@ class MainWindow(ft.Column):
                 except Exception as ex:
                     self.logger.debug(f"Could not auto-load graphs data: {ex}")
             
+            # NMT log only builds controls while its tab is on screen
+            self.modules["nmt"].set_tab_visible(selected_tab == 3, update=False)
+            
             self.page.update()
         
         # Create tabs for each module
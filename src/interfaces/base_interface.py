@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Callable, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 @dataclass
@@ -14,6 +14,10 @@ class CANMessage:
     message_type: str
     length: int
     raw_data: bytes = None
+    is_pdo: bool = field(init=False, default=False)  # Classified once from message_type
+
+    def __post_init__(self):
+        self.is_pdo = isinstance(self.message_type, str) and self.message_type.startswith(("PDO", "RPDO", "TPDO"))
 
 class BaseCANInterface(ABC):
     """Base interface for CAN communication implementations"""
@@ -31,6 +31,7 @@ class InterfaceManager:
         self.current_interface: Optional[BaseCANInterface] = None
         self.interface_type: str = config.can_config.interface
         self.connection_callbacks: List[Callable[[bool], None]] = []
+        self._nmt_frame_cache: Dict[tuple, bytes] = {}  # (command_code, node_id) -> NMT payload
         self._initialized = True
     
     @classmethod
@@ -212,7 +213,10 @@ class InterfaceManager:
             
         try:
             # NMT messages use COB-ID 0x000 and contain [command, node_id]
-            data = [command_code, node_id]
+            key = (command_code, node_id)
+            data = self._nmt_frame_cache.get(key)
+            if data is None:
+                data = self._nmt_frame_cache.setdefault(key, bytes(key))
             
             # Send using send_can_frame method
             result = self.current_interface.send_can_frame(
@@ -270,10 +270,7 @@ class DataCollector:
             if self.selected_node_id != 0 and message.node_id != self.selected_node_id:
                 continue
                 
-            if (isinstance(message.message_type, str) and 
-                (message.message_type.startswith("PDO") or 
-                 message.message_type.startswith("RPDO") or 
-                 message.message_type.startswith("TPDO"))):
+            if message.is_pdo:
                 pdo_messages.append(message)
                 self.logger.info(f"🔍 DEBUG: Found PDO message: {message.message_type}, COB-ID: 0x{message.cob_id:03X}")
         
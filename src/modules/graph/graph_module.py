@@ -181,7 +181,7 @@ class GraphModule(ft.Column):
         except Exception as e:
             self.logger.debug(f"Could not auto-load from OD reader in Graph Module: {e}")
     
-    def load_od_data(self, od_module):
+    def load_od_data(self, od_module, update: bool = True):
         """Load OD data from OD reader module"""
         try:
             # Load OD data into variable manager
@@ -198,7 +198,8 @@ class GraphModule(ft.Column):
                 # Build variables list in variable manager
                 self.variable_manager.build_variables_list(
                     self.data_collector.cob_id_to_pdo, 
-                    self.data_collector
+                    self.data_collector,
+                    update=False
                 )
                 
                 # Set PDO variables in data collector for tracking
@@ -207,12 +208,12 @@ class GraphModule(ft.Column):
                 self.logger.info(f"Built variables list with {self.variable_manager.get_variable_count()} variables")
             else:
                 self.logger.warning("No PDO mappings found in OD module")
-                self.variable_manager.build_variables_list({}, self.data_collector)
+                self.variable_manager.build_variables_list({}, self.data_collector, update=False)
             
-            self.update_control_panel_stats()
+            self.update_control_panel_stats(update=False)
             
             # Force UI update
-            if self.page:
+            if update and self.page:
                 self.page.update()
             
         except Exception as e:
@@ -339,8 +340,8 @@ class GraphModule(ft.Column):
     def get_selected_variables_data(self) -> Dict[str, List[tuple]]:
         return self.variable_manager.get_selected_variables_data(self.data_collector)
     
-    def update_control_panel_stats(self):
-        """Update statistics in control panel"""
+    def update_control_panel_stats(self, update: bool = True):
+        """Update statistics in control panel (update=False leaves sending the changes to the caller)"""
         try:
             var_count = self.variable_manager.get_variable_count()
             graph_count = len(self.graph_display.graphs)
@@ -351,18 +352,18 @@ class GraphModule(ft.Column):
                 self.control_panel.controls[-1].value = f"Graphs: {graph_count}"
 
                 # Force update of the control panel
-                if hasattr(self.control_panel, 'update'):
+                if update and hasattr(self.control_panel, 'update'):
                     self.control_panel.update()
 
             # Force update of the entire page
-            if self.page and hasattr(self.page, 'update'):
+            if update and self.page and hasattr(self.page, 'update'):
                 try:
                     self.page.update()
                 except Exception as page_error:
                     self.logger.debug(f"Page update failed in stats update: {page_error}")
                     
             # Also force update of the graph display area
-            if hasattr(self, 'graph_display') and self.graph_display:
+            if update and hasattr(self, 'graph_display') and self.graph_display:
                 if hasattr(self.graph_display, 'graph_area') and self.graph_display.graph_area:
                     self.graph_display.graph_area.update()
             
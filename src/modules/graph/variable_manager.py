@@ -53,8 +53,8 @@ class VariableManager:
             import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
     
-    def build_variables_list(self, cob_id_to_pdo, data_collector):
-        """Build the variables list with drag and drop support for selection"""
+    def build_variables_list(self, cob_id_to_pdo, data_collector, update: bool = True):
+        """Build the variables list with drag and drop support for selection (update=False leaves the page update to the caller)"""
         try:
             self.logger.info(f"Building variables list with {len(cob_id_to_pdo)} PDO mappings")
             
@@ -79,8 +79,9 @@ class VariableManager:
             for cob_id, pdo_info in cob_id_to_pdo.items():
                 pdo_data = pdo_info['pdo_info']
                 pdo_type = pdo_info['type']
+                cob_id_hex = f"0x{cob_id:03X}"  # Same for every variable of this PDO
                 
-                self.logger.debug(f"Processing {pdo_type} with COB-ID 0x{cob_id:03X}, variables: {len(pdo_data.get('mapped_variables', []))}")
+                self.logger.debug(f"Processing {pdo_type} with COB-ID {cob_id_hex}, variables: {len(pdo_data.get('mapped_variables', []))}")
                 
                 for var in pdo_data.get('mapped_variables', []):
                     var_index = var['index']
@@ -93,7 +94,7 @@ class VariableManager:
                         # Store variable info
                         self.pdo_variables[var_index] = {
                             'name': var_name,
-                            'cob_id': f"0x{cob_id:03X}",
+                            'cob_id': cob_id_hex,
                             'type': pdo_type,
                             'bits': var['bit_length'],
                             'current_value': 'No data'
@@ -178,11 +179,11 @@ class VariableManager:
                 )
             
             # Force update of the variables list
-            if hasattr(self.variables_list, 'update'):
+            if update and hasattr(self.variables_list, 'update'):
                 self.variables_list.update()
                 
             # Force page update
-            if self.page and hasattr(self.page, 'update'):
+            if update and self.page and hasattr(self.page, 'update'):
                 try:
                     self.page.update()
                 except Exception as page_error:
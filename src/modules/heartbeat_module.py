@@ -2,6 +2,8 @@ import flet as ft
 from typing import Any
 
 class HeartbeatModule(ft.Column):
+    PLACEHOLDER_TEXT = "Heartbeat Module - Coming Soon"
+
     def __init__(self, page: ft.Page, config: Any, logger: Any):
         super().__init__()
         self.page = page
@@ -9,12 +11,11 @@ class HeartbeatModule(ft.Column):
         self.logger = logger
         
     def initialize(self):
-        """Initialize the heartbeat module"""
-        self.controls = [
-            ft.Container(
-                content=ft.Text("Heartbeat Module - Coming Soon", size=20),
-                alignment=ft.alignment.center,
-                expand=True
-            )
-        ]
+        """Initialize the heartbeat module (the placeholder is only built once)"""
+        if self.controls:
+            return
+        # The column centers the placeholder itself, so no wrapping Container is needed
+        self.controls = [ft.Text(self.PLACEHOLDER_TEXT, size=20)]
+        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
         self.expand = True
@@ -1,36 +1,66 @@
 import flet as ft
+import struct
 import threading
 import time
+from collections import deque
 from typing import Any, List, Optional, Dict
 from datetime import datetime
 
 from interfaces import InterfaceManager, CANMessage
 
+# Little-endian decoders for byte-aligned 8/16/32-bit PDO variables
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_ALIGNED_DECODERS = {8: _U8.unpack_from, 16: _U16.unpack_from, 32: _U32.unpack_from}
+
+# Fixed-width layout of the CAN messages text view
+_MESSAGE_ROW_FORMAT = "{:<12} {:<7} {:>4}  {:<22} {:<23} {}"
+_MESSAGE_HEADER = _MESSAGE_ROW_FORMAT.format("Time", "COB-ID", "Node", "Type", "Data", "Len")
+
 class MonitorModule(ft.Column):
+    # Seconds between stats-thread passes; each pass flushes the dirty message view and counters (10 Hz)
+    STATS_UPDATE_INTERVAL = 0.1
+
     def __init__(self, page: ft.Page, config: Any, logger: Any, interface_manager: InterfaceManager = None):
         super().__init__()
         self.page = page
         self.config = config
         self.logger = logger
         self.is_monitoring = False
-        self.message_list = []
+        self.message_list = deque(maxlen=1000)
+        self._filtered_ring = deque(maxlen=100)  # [message, row] entries (newest first) matching the filter
+        self._ring_appends = 0  # Entries pushed by the rx thread (single writer)
+        self._flushed_appends = 0
+        # _ring_lock: message_list/_filtered_ring appends (rx thread) vs. ring rebuilds and snapshots.
+        # _flush_lock: serializes message view flushes, which run on both the UI and stats threads.
+        self._ring_lock = threading.Lock()
+        self._flush_lock = threading.RLock()
+        self._dropped_display_count = 0  # Entries evicted before they were ever rendered
         self.message_table = None
+        self.message_header = None
         self.pdo_variables_table = None  # New PDO variables table
         self.control_buttons = None
         # Use singleton instance
         self.interface_manager = interface_manager or InterfaceManager.get_instance()
         self.od_reader_module = None  # Reference to OD reader module
         self.od_registers = []  # Store OD registers for message interpretation
+        self._od_name_by_index = {}  # "0xIIII" (upper case) -> register name, for SDO lookups
         self.pdo_mappings = {}  # Store PDO mappings
         self.pdo_variables = {}  # Store current PDO variable values {index: value}
         self.cob_id_to_pdo = {}  # Map COB-ID to PDO info for quick lookup
+        self.pdo_decode_plans = {}  # Map COB-ID to precomputed variable decoders
         self.stats_controls = {}
         self.filter_node_id = None
         self.selected_node_id = 0  # Node ID selected from dropdown
         self.message_count = 0
         self.error_count = 0
-        self.last_update_time = time.time()
-        self.messages_since_last_update = 0
+        # Rate is computed by differencing a monotonic counter (single writer: rx thread)
+        self._total_rx_count = 0
+        self._last_stats_count = 0
+        self._last_stats_time = time.monotonic()
+        self._ui_dirty = False  # Set by rx thread, flushed by the stats thread
+        self._ts_prefix_cache = (-1, "")  # (second of day, "HH:MM:SS") of the last formatted timestamp
         
     def initialize(self):
         """Initialize the monitor module"""
@@ -42,21 +72,10 @@ class MonitorModule(ft.Column):
             if not self.interface_manager.initialize_interface():
                 self.logger.error("Failed to initialize CAN interface")
         
-        # Create message table
-        self.message_table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Time", size=12)),
-                ft.DataColumn(ft.Text("COB-ID", size=12)),
-                ft.DataColumn(ft.Text("Node", size=12)),
-                ft.DataColumn(ft.Text("Type", size=12)),
-                ft.DataColumn(ft.Text("Data", size=12)),
-                ft.DataColumn(ft.Text("Len", size=12))
-            ],
-            rows=[],
-            heading_row_height=30,
-            data_row_min_height=25,
-            data_row_max_height=25,
-        )
+        # Create message view: one pre-joined monospace Text instead of a DataTable,
+        # so each UI flush diffs a single value rather than 100x6 cells
+        self.message_header = ft.Text(_MESSAGE_HEADER, font_family="Consolas", size=12, weight=ft.FontWeight.BOLD)
+        self.message_table = ft.Text("", font_family="Consolas", size=12, selectable=True)
         
         # Create PDO variables table for manufacturer registers
         self.pdo_variables_table = ft.DataTable(
@@ -146,6 +165,7 @@ class MonitorModule(ft.Column):
                     ft.Text("CAN Messages", size=14, weight=ft.FontWeight.BOLD),
                     ft.Container(
                         content=ft.Column([
+                            self.message_header,
                             self.message_table
                         ], scroll=ft.ScrollMode.AUTO),
                         expand=True,
@@ -200,12 +220,15 @@ class MonitorModule(ft.Column):
                 return
             
             # Clear existing messages for a clean start
-            self.message_list.clear()
-            self.message_table.rows.clear()
+            with self._flush_lock, self._ring_lock:
+                self.message_list.clear()
+                self._filtered_ring.clear()
+                self.message_table.value = ""
             self.message_count = 0
             self.error_count = 0
-            self.messages_since_last_update = 0
-            self.last_update_time = time.time()
+            self._total_rx_count = 0
+            self._last_stats_count = 0
+            self._last_stats_time = time.monotonic()
             
             # Add message callback
             self.interface_manager.add_message_callback(self.on_message_received)
@@ -240,8 +263,10 @@ class MonitorModule(ft.Column):
     
     def clear_messages(self, e):
         """Clear message history and reset PDO variables"""
-        self.message_list.clear()
-        self.message_table.rows.clear()
+        with self._flush_lock, self._ring_lock:
+            self.message_list.clear()
+            self._filtered_ring.clear()
+            self.message_table.value = ""
         
         # Reset PDO variable values
         for var_index in self.pdo_variables:
@@ -277,7 +302,7 @@ class MonitorModule(ft.Column):
             else:
                 self.filter_node_id = int(filter_text)
             
-            self.rebuild_message_table()
+            self._recompute_filtered_ring()
             self.logger.info(f"Message filter set to node ID: {self.filter_node_id}")
         except ValueError:
             self.logger.warning(f"Invalid node ID filter: {e.control.value}")
@@ -288,12 +313,7 @@ class MonitorModule(ft.Column):
             od_module = self.get_od_reader_module()
             if od_module and hasattr(od_module, "registers") and od_module.registers:
                 # Store registers for message interpretation
-                self.od_registers = []
-                for reg in od_module.registers:
-                    reg_copy = dict(reg)
-                    if "dataLength" in reg_copy:
-                        reg_copy["data_length"] = reg_copy.pop("dataLength")
-                    self.od_registers.append(reg_copy)
+                self._set_od_registers(od_module.registers)
                 
                 self.logger.info(f"Loaded {len(self.od_registers)} OD registers for message interpretation")
         except Exception as e:
@@ -310,21 +330,29 @@ class MonitorModule(ft.Column):
         if od_reader_module and hasattr(od_reader_module, "registers") and od_reader_module.registers:
             self.load_od_data(od_reader_module)
     
-    def load_od_data(self, od_module):
+    def _set_od_registers(self, registers):
+        """Copy OD registers for message interpretation and index their names by OD index"""
+        self.od_registers = []
+        for reg in registers:
+            reg_copy = dict(reg)
+            if "dataLength" in reg_copy:
+                reg_copy["data_length"] = reg_copy.pop("dataLength")
+            self.od_registers.append(reg_copy)
+        self._od_name_by_index = {
+            reg.get("index", "").upper(): reg.get("name", "Unknown") for reg in self.od_registers
+        }
+    
+    def load_od_data(self, od_module, update: bool = True):
         """Load OD data from OD reader module (using registers list)"""
         try:
-            self.od_registers = []
-            for reg in od_module.registers:
-                reg_copy = dict(reg)
-                if "dataLength" in reg_copy:
-                    reg_copy["data_length"] = reg_copy.pop("dataLength")
-                self.od_registers.append(reg_copy)
+            self._set_od_registers(od_module.registers)
             
             # Load PDO mappings if available
             if hasattr(od_module, 'pdo_mappings') and od_module.pdo_mappings:
                 self.pdo_mappings = od_module.pdo_mappings
                 self.build_cob_id_mapping()
-                self.build_pdo_variables_table()
+                self.build_pdo_variables_table(update=update)
+                self.build_pdo_decode_plans()
                 self.logger.info(f"Loaded PDO mappings: {len(self.pdo_mappings.get('rpdos', []))} RPDOs, {len(self.pdo_mappings.get('tpdos', []))} TPDOs")
             
             self.logger.info(f"Loaded {len(self.od_registers)} OD registers for message interpretation")
@@ -355,7 +383,7 @@ class MonitorModule(ft.Column):
         
         self.logger.info(f"Built COB-ID mapping for {len(self.cob_id_to_pdo)} enabled PDOs")
     
-    def build_pdo_variables_table(self):
+    def build_pdo_variables_table(self, update: bool = True):
         """Build the PDO variables table with manufacturer registers only"""
         self.pdo_variables_table.rows.clear()
         self.pdo_variables = {}
@@ -370,6 +398,7 @@ class MonitorModule(ft.Column):
         for cob_id, pdo_info in self.cob_id_to_pdo.items():
             pdo_data = pdo_info['pdo_info']
             pdo_type = pdo_info['type']
+            cob_id_hex = f"0x{cob_id:03X}"  # Same for every variable of this PDO
             
             for var in pdo_data['mapped_variables']:
                 var_index = var['index']
@@ -381,7 +410,7 @@ class MonitorModule(ft.Column):
                     # Initialize variable value
                     self.pdo_variables[var_index] = {
                         'value': 'No data',
-                        'cob_id': f"0x{cob_id:03X}",
+                        'cob_id': cob_id_hex,
                         'type': pdo_type,
                         'last_update': 'Never',
                         'bits': var['bit_length'],
@@ -395,7 +424,7 @@ class MonitorModule(ft.Column):
                             ft.DataCell(ft.Text(var_index, size=11)),
                             ft.DataCell(ft.Text(var_name[:20], size=11)),  # Truncate long names
                             ft.DataCell(ft.Text('No data', size=11)),
-                            ft.DataCell(ft.Text(f"0x{cob_id:03X}", size=11)),
+                            ft.DataCell(ft.Text(cob_id_hex, size=11)),
                             ft.DataCell(ft.Text('Never', size=11))
                         ]
                     )
@@ -403,7 +432,8 @@ class MonitorModule(ft.Column):
         
         # Update statistics
         self.stats_controls["pdo_count"].value = f"PDO Variables: {len(self.pdo_variables)}"
-        self.page.update()
+        if update:
+            self.page.update()
     
     def process_pdo_message(self, message: CANMessage):
         """Process PDO messages and extract variable values"""
@@ -425,61 +455,81 @@ class MonitorModule(ft.Column):
             # Buscar el PDO usando el COB-ID normalizado
             # print(f"DEBUG: Processing PDO message with COB-ID: {cob_id:03X}, normalized: {normalized_cob_id:03X}")
 
-            if normalized_cob_id not in self.cob_id_to_pdo:
+            plan = self.pdo_decode_plans.get(normalized_cob_id)
+            if not plan:
                 return
 
-            pdo_info = self.cob_id_to_pdo[normalized_cob_id]
-            pdo_data = pdo_info['pdo_info']
+            data = message.data
+            raw = message.raw_data if message.raw_data is not None else bytes(data)
+            data_len = len(data)
+
+            # Extract values for each mapped manufacturer variable
+            for var_index, decoder, byte_start, byte_end, bit_offset, bit_length in plan:
+                if byte_end >= data_len:
+                    continue
+
+                if decoder is not None:
+                    value = decoder(raw, byte_start)[0]
+                else:
+                    value = self._extract_bits(data, byte_start, byte_end, bit_offset, bit_length)
+
+                # Update variable value
+                var_data = self.pdo_variables[var_index]
+                var_data['value'] = str(value)
+                var_data['last_update'] = self._format_timestamp(message.timestamp)
             
-            # Extract values for each mapped variable
+            # Update PDO table display
+            self.update_pdo_variables_table()
+            
+        except Exception as e:
+            self.logger.error(f"Error processing PDO message: {e}")
+    
+    def build_pdo_decode_plans(self):
+        """Precompute per-COB-ID decoders for the mapped manufacturer variables"""
+        self.pdo_decode_plans = {}
+        
+        for cob_id, pdo_info in self.cob_id_to_pdo.items():
+            plan = []
             bit_offset = 0
-            for var in pdo_data['mapped_variables']:
+            for var in pdo_info['pdo_info']['mapped_variables']:
                 var_index = var['index']
                 bit_length = var['bit_length']
                 
                 # Only process manufacturer variables
-                if var_index not in self.pdo_variables:
-                    bit_offset += bit_length
-                    continue
-                
-                # Calculate byte positions
-                byte_start = bit_offset // 8
-                byte_end = (bit_offset + bit_length - 1) // 8
-                
-                if byte_end < len(message.data):
-                    # Extract value based on bit length
-                    if bit_length <= 8:
-                        value = message.data[byte_start]
-                        if bit_length < 8:
-                            # Handle partial byte
-                            bit_pos = bit_offset % 8
-                            mask = ((1 << bit_length) - 1) << bit_pos
-                            value = (value & mask) >> bit_pos
-                    elif bit_length <= 16:
-                        if byte_start + 1 < len(message.data):
-                            value = message.data[byte_start] | (message.data[byte_start + 1] << 8)
-                        else:
-                            value = message.data[byte_start]
-                    elif bit_length <= 32:
-                        value = 0
-                        for i in range(min(4, len(message.data) - byte_start)):
-                            value |= message.data[byte_start + i] << (i * 8)
-                    else:
-                        # For larger values, show as hex string
-                        hex_bytes = message.data[byte_start:byte_end + 1]
-                        value = " ".join([f"{b:02X}" for b in hex_bytes])
-                    
-                    # Update variable value
-                    self.pdo_variables[var_index]['value'] = str(value)
-                    self.pdo_variables[var_index]['last_update'] = message.timestamp.strftime("%H:%M:%S.%f")[:-3]
+                if var_index in self.pdo_variables:
+                    byte_start = bit_offset // 8
+                    byte_end = (bit_offset + bit_length - 1) // 8
+                    decoder = _ALIGNED_DECODERS.get(bit_length) if bit_offset % 8 == 0 else None
+                    plan.append((var_index, decoder, byte_start, byte_end, bit_offset, bit_length))
                 
                 bit_offset += bit_length
             
-            # Update PDO table display
-            self.update_pdo_variables_table()
-            
-        except Exception as e:
-            self.logger.error(f"Error processing PDO message: {e}")
+            if plan:
+                self.pdo_decode_plans[cob_id] = tuple(plan)
+    
+    @staticmethod
+    def _extract_bits(data, byte_start: int, byte_end: int, bit_offset: int, bit_length: int):
+        """Fallback decoder for unaligned or odd-width PDO variables"""
+        if bit_length <= 8:
+            value = data[byte_start]
+            if bit_length < 8:
+                # Handle partial byte
+                bit_pos = bit_offset % 8
+                mask = ((1 << bit_length) - 1) << bit_pos
+                value = (value & mask) >> bit_pos
+        elif bit_length <= 16:
+            if byte_start + 1 < len(data):
+                value = data[byte_start] | (data[byte_start + 1] << 8)
+            else:
+                value = data[byte_start]
+        elif bit_length <= 32:
+            value = 0
+            for i in range(min(4, len(data) - byte_start)):
+                value |= data[byte_start + i] << (i * 8)
+        else:
+            # For larger values, show as hex string
+            value = " ".join([f"{b:02X}" for b in data[byte_start:byte_end + 1]])
+        return value
     
     def update_pdo_variables_table(self):
         """Update PDO variables table with current values"""
@@ -512,12 +562,12 @@ class MonitorModule(ft.Column):
             # For SDO messages, try to find matching OD entry
             if message.message_type in ["SDO_REQUEST", "SDO_RESPONSE"] and len(message.data) >= 4:
                 # Extract index from SDO message
-                index_from_msg = f"0x{message.data[2]:02X}{message.data[1]:02X}"
+                index_from_msg = f"0X{message.data[2]:02X}{message.data[1]:02X}"
                 
                 # Find matching OD entry
-                for reg in self.od_registers:
-                    if reg.get("index", "").upper() == index_from_msg.upper():
-                        return f"{message.message_type} ({reg.get('name', 'Unknown')})"
+                reg_name = self._od_name_by_index.get(index_from_msg)
+                if reg_name is not None:
+                    return f"{message.message_type} ({reg_name})"
             
             return message.message_type
             
@@ -529,101 +579,98 @@ class MonitorModule(ft.Column):
         """Callback for received CAN messages"""
         # print(f"🔍 DEBUG: MonitorModule - Message received: {message}")
         try:
-            self.message_list.append(message)
-            self.message_count += 1
-            self.messages_since_last_update += 1
-
-            # Process PDO messages if type starts with 'PDO', 'RPDO', or 'TPDO'
-            if (
-                isinstance(message.message_type, str)
-                and (
-                    message.message_type.startswith("PDO")
-                    or message.message_type.startswith("RPDO")
-                    or message.message_type.startswith("TPDO")
-                )
-            ):
-                self.process_pdo_message(message)
-
-            # Keep only last 1000 messages
-            if len(self.message_list) > 1000:
-                self.message_list.pop(0)
+            # History and ring are appended together so a ring rebuild never misses
+            # or duplicates a message
+            with self._ring_lock:
+                self.message_list.append(message)
 
-            # Add to table if it matches filter
-            if self.filter_node_id is None or message.node_id == self.filter_node_id:
-                # Format time
-                time_str = message.timestamp.strftime("%H:%M:%S.%f")[:-3]
+                # Add to table if it matches filter (ring evicts entries beyond the last 100).
+                # The row itself is only built at flush time, so bursts that overrun the
+                # ring between two flushes cost no formatting for the evicted messages.
+                if self.filter_node_id is None or message.node_id == self.filter_node_id:
+                    self._filtered_ring.appendleft([message, None])
+                    self._ring_appends += 1
 
-                # Format data as hex string
-                data_str = " ".join([f"{b:02X}" for b in message.data])
+                    # UI is refreshed by the stats thread (not every message for performance)
+                    self._ui_dirty = True
 
-                # Interpret message type using OD data if available
-                interpreted_type = self.interpret_message_with_od(message)
-
-                # Create new row
-                new_row = ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(time_str)),
-                        ft.DataCell(ft.Text(f"0x{message.cob_id:03X}")),
-                        ft.DataCell(ft.Text(str(message.node_id))),
-                        ft.DataCell(ft.Text(interpreted_type)),
-                        ft.DataCell(ft.Text(data_str)),
-                        ft.DataCell(ft.Text(str(message.length)))
-                    ]
-                )
-
-                # Add to beginning of table (newest first)
-                self.message_table.rows.insert(0, new_row)
-
-                # Keep only last 100 rows in table for performance
-                if len(self.message_table.rows) > 100:
-                    self.message_table.rows.pop()
+            self.message_count += 1
+            self._total_rx_count += 1
 
-                # Update UI periodically (not every message for performance)
-                if self.messages_since_last_update >= 10:
-                    self.page.update()
-                    self.messages_since_last_update = 0
+            # Process PDO messages (type starts with 'PDO', 'RPDO', or 'TPDO')
+            if message.is_pdo:
+                self.process_pdo_message(message)
 
         except Exception as ex:
             self.logger.error(f"Error processing received message: {ex}")
             self.error_count += 1
     
-    def rebuild_message_table(self):
-        """Rebuild message table with current filter"""
-        self.message_table.rows.clear()
-        
-        filtered_messages = self.message_list
-        if self.filter_node_id is not None:
-            filtered_messages = [msg for msg in self.message_list if msg.node_id == self.filter_node_id]
-        
-        # Add last 100 messages to table (newest first)
-        for message in reversed(filtered_messages[-100:]):
-            time_str = message.timestamp.strftime("%H:%M:%S.%f")[:-3]
-            data_str = " ".join([f"{b:02X}" for b in message.data])
-            
+    def _format_timestamp(self, ts: datetime) -> str:
+        """Format a timestamp as HH:MM:SS.mmm, reusing the HH:MM:SS prefix within the same second"""
+        sec_key = ts.hour * 3600 + ts.minute * 60 + ts.second
+        key, prefix = self._ts_prefix_cache
+        if key != sec_key:
+            prefix = f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+            self._ts_prefix_cache = (sec_key, prefix)
+        return f"{prefix}.{ts.microsecond // 1000:03d}"
+    
+    def _build_message_row(self, message: CANMessage) -> str:
+        """Format a message as one fixed-width text row"""
+        return _MESSAGE_ROW_FORMAT.format(
+            self._format_timestamp(message.timestamp),
+            f"0x{message.cob_id:03X}",
+            message.node_id,
             # Interpret message type using OD data if available
-            interpreted_type = self.interpret_message_with_od(message)
+            self.interpret_message_with_od(message),
+            " ".join([f"{b:02X}" for b in message.data]),
+            message.length
+        )
+    
+    def _recompute_filtered_ring(self):
+        """Rebuild the displayed rows from message history after a filter change"""
+        with self._flush_lock:
+            # The rx thread waits while the ring is rebuilt, so no message lands in the old ring
+            with self._ring_lock:
+                matching = []
+                for message in reversed(self.message_list):
+                    if self.filter_node_id is None or message.node_id == self.filter_node_id:
+                        matching.append(message)
+                        if len(matching) >= self._filtered_ring.maxlen:
+                            break
+                
+                # Newest first
+                self._filtered_ring = deque(
+                    ([message, None] for message in matching),
+                    maxlen=self._filtered_ring.maxlen
+                )
+                self._flushed_appends = self._ring_appends
+            self._flush_message_table()
+        self.page.update()
+    
+    def _flush_message_table(self):
+        """Format new ring entries and publish them to the message view"""
+        with self._flush_lock:
+            with self._ring_lock:
+                appends = self._ring_appends
+                entries = list(self._filtered_ring)
             
-            new_row = ft.DataRow(
-                cells=[
-                    ft.DataCell(ft.Text(time_str)),
-                    ft.DataCell(ft.Text(f"0x{message.cob_id:03X}")),
-                    ft.DataCell(ft.Text(str(message.node_id))),
-                    ft.DataCell(ft.Text(interpreted_type)),
-                    ft.DataCell(ft.Text(data_str)),
-                    ft.DataCell(ft.Text(str(message.length)))
-                ]
-            )
+            # Rows are formatted outside _ring_lock so the rx thread is not held up
+            built = 0
+            for entry in entries:
+                if entry[1] is None:
+                    entry[1] = self._build_message_row(entry[0])
+                    built += 1
             
-            self.message_table.rows.append(new_row)
-        
-        self.page.update()
+            self._dropped_display_count += max(0, appends - self._flushed_appends - built)
+            self._flushed_appends = appends
+            self.message_table.value = "\n".join([entry[1] for entry in entries])
     
     def start_stats_update(self):
         """Start statistics update thread"""
         def update_stats():
             while self.is_monitoring:
                 self.update_statistics()
-                time.sleep(0.001)  # Update every second
+                time.sleep(self.STATS_UPDATE_INTERVAL)
         
         stats_thread = threading.Thread(target=update_stats)
         stats_thread.daemon = True
@@ -632,30 +679,51 @@ class MonitorModule(ft.Column):
     def update_statistics(self):
         """Update statistics display"""
         try:
-            current_time = time.time()
-            time_elapsed = current_time - self.last_update_time
+            changed = self._ui_dirty
+            if changed:
+                self._ui_dirty = False
+                self._flush_message_table()
+            
+            now = time.monotonic()
+            time_elapsed = now - self._last_stats_time
             
             if time_elapsed >= 1.0:  # Update rate every second
-                rate = self.messages_since_last_update / time_elapsed
+                total = self._total_rx_count
+                rate = (total - self._last_stats_count) / time_elapsed
                 self.stats_controls["rate"].value = f"Rate: {rate:.1f} msg/s"
-                self.last_update_time = current_time
-                self.messages_since_last_update = 0
+                self._last_stats_count = total
+                self._last_stats_time = now
+                changed = True
+                
+                with self._flush_lock:
+                    if self._dropped_display_count:
+                        self.logger.debug(f"Skipped formatting {self._dropped_display_count} messages evicted before display")
+                        self._dropped_display_count = 0
             
-            self.stats_controls["msg_count"].value = f"Messages: {self.message_count}"
-            self.stats_controls["error_count"].value = f"Errors: {self.error_count}"
+            msg_count_text = f"Messages: {self.message_count}"
+            error_count_text = f"Errors: {self.error_count}"
+            if msg_count_text != self.stats_controls["msg_count"].value:
+                self.stats_controls["msg_count"].value = msg_count_text
+                changed = True
+            if error_count_text != self.stats_controls["error_count"].value:
+                self.stats_controls["error_count"].value = error_count_text
+                changed = True
             
             # Update interface status
             if self.interface_manager.is_monitoring():
-                self.stats_controls["interface_status"].value = "Status: Monitoring"
-                self.stats_controls["interface_status"].color = ft.Colors.GREEN
+                status, color = "Status: Monitoring", ft.Colors.GREEN
             elif self.interface_manager.is_connected():
-                self.stats_controls["interface_status"].value = "Status: Connected"
-                self.stats_controls["interface_status"].color = ft.Colors.BLUE
+                status, color = "Status: Connected", ft.Colors.BLUE
             else:
-                self.stats_controls["interface_status"].value = "Status: Disconnected"
-                self.stats_controls["interface_status"].color = ft.Colors.RED
-                
-            self.page.update()
+                status, color = "Status: Disconnected", ft.Colors.RED
+            if status != self.stats_controls["interface_status"].value:
+                self.stats_controls["interface_status"].value = status
+                self.stats_controls["interface_status"].color = color
+                changed = True
+            
+            # Only push to the page when something visible changed
+            if changed:
+                self.page.update()
                 
         except Exception as ex:
             self.logger.error(f"Error updating statistics: {ex}")
@@ -1,8 +1,14 @@
 import flet as ft
+import threading
+import time
+from collections import deque
 from typing import Any, Optional
 from interfaces.interface_manager import InterfaceManager
 
 class NMTModule(ft.Column):
+    # Heartbeat-driven UI changes are coalesced into one flush per interval (seconds)
+    UI_FLUSH_INTERVAL = 0.1
+    
     def __init__(self, page: ft.Page, config: Any, logger: Any, interface_manager: Optional[InterfaceManager] = None):
         super().__init__()
         self.page = page
@@ -18,6 +24,9 @@ class NMTModule(ft.Column):
             "RESET_NODE": 0x81,
             "RESET_COMMUNICATION": 0x82
         }
+        self._COMMAND_KEYS = {code: key for key, code in self.NMT_COMMANDS.items()}
+        self._COMMAND_DISPLAY = {key: key.replace("_", " ").title() for key in self.NMT_COMMANDS}
+        self._CMD_HEX = {code: f"0x{code:02X}" for code in self.NMT_COMMANDS.values()}
         
         # NMT State descriptions
         self.NMT_STATES = {
@@ -26,6 +35,8 @@ class NMTModule(ft.Column):
             0x05: "Operational", 
             0x7F: "Pre-operational"
         }
+        # State name for every possible state byte, indexed directly by the heartbeat payload
+        self._STATE_NAMES = tuple(self.NMT_STATES.get(i, f"Unknown (0x{i:02X})") for i in range(256))
         
         # UI Controls
         self.node_id_field = None
@@ -33,7 +44,23 @@ class NMTModule(ft.Column):
         self.send_button = None
         self.status_text = None
         self.log_container = None
+        self._log_entries = deque(maxlen=20)  # Last 20 log Text controls (header excluded)
         self.detected_nodes_list = None
+        self._node_controls = {}  # node_id -> ft.Text in detected_nodes_list
+        self._nodes_placeholder_active = True  # "No nodes detected yet" still shown
+        self._dirty_log = False
+        self._dirty_nodes = False
+        self._flush_timer: Optional[threading.Timer] = None
+        # Guards _flush_timer and the dirty flags between the rx thread and the flush timer thread
+        self._flush_lock = threading.Lock()
+        self._ts_cache = (-1, "")  # (epoch second, "HH:MM:SS") of the last log timestamp
+        self._tab_visible = False  # Set by the main window when the NMT tab is selected
+        self._pending_log = deque(maxlen=20)  # (timestamp, message, color) while the tab is hidden
+        # Guards _tab_visible, _pending_log, _log_entries and the log controls: entries come from
+        # the rx thread while the UI thread shows or hides the tab
+        self._log_lock = threading.Lock()
+        # page is set once above and never cleared, so bind its update method once
+        self._page_update = self.page.update if self.page else (lambda: None)
         
     def initialize(self):
         """Initialize the NMT module"""
@@ -59,14 +86,15 @@ class NMTModule(ft.Column):
         self.command_dropdown = ft.Dropdown(
             label="NMT Command",
             width=250,
+            # Option keys carry the NMT command code itself
             options=[
-                ft.dropdown.Option("START_REMOTE_NODE", "Start Remote Node"),
-                ft.dropdown.Option("STOP_REMOTE_NODE", "Stop Remote Node"),
-                ft.dropdown.Option("ENTER_PRE_OPERATIONAL", "Enter Pre-operational"),
-                ft.dropdown.Option("RESET_NODE", "Reset Node"),
-                ft.dropdown.Option("RESET_COMMUNICATION", "Reset Communication"),
+                ft.dropdown.Option(str(self.NMT_COMMANDS["START_REMOTE_NODE"]), "Start Remote Node"),
+                ft.dropdown.Option(str(self.NMT_COMMANDS["STOP_REMOTE_NODE"]), "Stop Remote Node"),
+                ft.dropdown.Option(str(self.NMT_COMMANDS["ENTER_PRE_OPERATIONAL"]), "Enter Pre-operational"),
+                ft.dropdown.Option(str(self.NMT_COMMANDS["RESET_NODE"]), "Reset Node"),
+                ft.dropdown.Option(str(self.NMT_COMMANDS["RESET_COMMUNICATION"]), "Reset Communication"),
             ],
-            value="START_REMOTE_NODE"
+            value=str(self.NMT_COMMANDS["START_REMOTE_NODE"])
         )
         
         # Send button
@@ -92,36 +120,38 @@ class NMTModule(ft.Column):
             ft.ElevatedButton(
                 "Start All",
                 icon=ft.Icons.PLAY_ARROW,
-                on_click=lambda e: self.send_broadcast_command("START_REMOTE_NODE"),
+                on_click=lambda e, code=self.NMT_COMMANDS["START_REMOTE_NODE"]: self.send_broadcast_command(code),
                 bgcolor=ft.Colors.GREEN_100
             ),
             ft.ElevatedButton(
                 "Stop All", 
                 icon=ft.Icons.STOP,
-                on_click=lambda e: self.send_broadcast_command("STOP_REMOTE_NODE"),
+                on_click=lambda e, code=self.NMT_COMMANDS["STOP_REMOTE_NODE"]: self.send_broadcast_command(code),
                 bgcolor=ft.Colors.RED_100
             ),
             ft.ElevatedButton(
                 "Pre-op All",
                 icon=ft.Icons.PAUSE,
-                on_click=lambda e: self.send_broadcast_command("ENTER_PRE_OPERATIONAL"),
+                on_click=lambda e, code=self.NMT_COMMANDS["ENTER_PRE_OPERATIONAL"]: self.send_broadcast_command(code),
                 bgcolor=ft.Colors.ORANGE_100
             ),
             ft.ElevatedButton(
                 "Reset All",
                 icon=ft.Icons.REFRESH,
-                on_click=lambda e: self.send_broadcast_command("RESET_NODE"),
+                on_click=lambda e, code=self.NMT_COMMANDS["RESET_NODE"]: self.send_broadcast_command(code),
                 bgcolor=ft.Colors.PURPLE_100
             )
         ])
         
         # Command log
+        self._log_entries.clear()
+        self._log_entries.append(ft.Text("Ready to send NMT commands...", color=ft.Colors.GREY))
         self.log_container = ft.Column(
             height=200,
             scroll=ft.ScrollMode.ALWAYS,
             controls=[
                 ft.Text("NMT Command Log:", weight=ft.FontWeight.BOLD),
-                ft.Text("Ready to send NMT commands...", color=ft.Colors.GREY)
+                *self._log_entries
             ]
         )
         
@@ -134,6 +164,7 @@ class NMTModule(ft.Column):
                 ft.Text("No nodes detected yet", color=ft.Colors.GREY)
             ]
         )
+        self._nodes_placeholder_active = True
         
         # Main interface layout
         self.controls = [
@@ -225,8 +256,7 @@ class NMTModule(ft.Column):
             self.status_text.color = ft.Colors.RED
             self.send_button.disabled = True
         
-        if self.page:
-            self.page.update()
+        self._page_update()
     
     def on_connection_change(self, connected: bool):
         """Handle connection state changes"""
@@ -236,33 +266,33 @@ class NMTModule(ft.Column):
         """Send individual NMT command"""
         try:
             node_id = int(self.node_id_field.value)
-            command_key = self.command_dropdown.value
+            command_code = int(self.command_dropdown.value)
             
             if node_id < 0 or node_id > 127:
                 self.add_log_entry("Error: Node ID must be between 0-127", ft.Colors.RED)
                 return
             
-            self.send_nmt_command_internal(command_key, node_id)
+            self.send_nmt_command_internal(command_code, node_id)
             
         except ValueError:
             self.add_log_entry("Error: Invalid Node ID", ft.Colors.RED)
         except Exception as ex:
             self.add_log_entry(f"Error: {str(ex)}", ft.Colors.RED)
     
-    def send_broadcast_command(self, command_key: str):
+    def send_broadcast_command(self, command_code: int):
         """Send broadcast NMT command (node ID = 0)"""
-        self.send_nmt_command_internal(command_key, 0)
+        self.send_nmt_command_internal(command_code, 0)
     
-    def send_nmt_command_internal(self, command_key: str, node_id: int):
+    def send_nmt_command_internal(self, command_code: int, node_id: int):
         """Internal method to send NMT command"""
         try:
             if not self.interface_manager or not self.interface_manager.is_connected():
                 self.add_log_entry("Error: Interface not connected", ft.Colors.RED)
                 return
             
-            command_code = self.NMT_COMMANDS.get(command_key)
-            if command_code is None:
-                self.add_log_entry(f"Error: Unknown command {command_key}", ft.Colors.RED)
+            command_key = self._COMMAND_KEYS.get(command_code)
+            if command_key is None:
+                self.add_log_entry(f"Error: Unknown command 0x{command_code:02X}", ft.Colors.RED)
                 return
             
             # Send NMT command through interface manager
@@ -270,9 +300,9 @@ class NMTModule(ft.Column):
             
             if success:
                 target = "All nodes" if node_id == 0 else f"Node {node_id}"
-                command_name = command_key.replace("_", " ").title()
+                command_name = self._COMMAND_DISPLAY[command_key]
                 self.add_log_entry(
-                    f"✓ Sent {command_name} to {target} (0x{command_code:02X})", 
+                    f"✓ Sent {command_name} to {target} ({self._CMD_HEX[command_code]})", 
                     ft.Colors.GREEN
                 )
                 self.logger.info(f"NMT command sent: {command_name} to {target}")
@@ -286,74 +316,132 @@ class NMTModule(ft.Column):
     
     def on_message_received(self, message):
         """Handle received CAN messages to detect node states"""
+        # Fast reject: only NMT bootup/heartbeat messages (COB-ID 0x700 + Node ID)
+        cob_id = getattr(message, "cob_id", None)
+        if cob_id is None or (cob_id & 0xFF80) != 0x700:
+            return
+        
+        data = message.data
+        if not data or len(data) != 1:
+            return
+        
+        node_id = cob_id & 0x7F
+        state_name = self._STATE_NAMES[data[0]]
+        
+        # Only the UI side can fail here
         try:
-            # Check for NMT bootup messages (COB-ID 0x700 + Node ID)
-            if 0x700 <= message.cob_id <= 0x77F:
-                node_id = message.cob_id - 0x700
-                if len(message.data) == 1:
-                    state_code = message.data[0]
-                    state_name = self.NMT_STATES.get(state_code, f"Unknown (0x{state_code:02X})")
-                    
-                    self.update_detected_node(node_id, state_name)
-                    self.add_log_entry(
-                        f"Node {node_id} state: {state_name}", 
-                        ft.Colors.BLUE
-                    )
-                    
+            self.update_detected_node(node_id, state_name, update=False)
+            shown = self.add_log_entry(
+                f"Node {node_id} state: {state_name}", 
+                ft.Colors.BLUE,
+                update=False
+            )
+            self._schedule_ui_flush(nodes=True, log=bool(shown))
         except Exception as ex:
             self.logger.debug(f"Error processing message for NMT: {ex}")
     
-    def update_detected_node(self, node_id: int, state: str):
+    def _schedule_ui_flush(self, nodes: bool = False, log: bool = False):
+        """Mark containers dirty and make sure a flush is pending for them"""
+        with self._flush_lock:
+            self._dirty_nodes |= nodes
+            self._dirty_log |= log
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.UI_FLUSH_INTERVAL, self._flush_ui)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_ui(self):
+        """Push the changes accumulated since the last flush, updating only the dirty containers"""
+        # Take the flags and release the timer slot together: anything marked dirty after
+        # this point schedules a new flush instead of being lost
+        with self._flush_lock:
+            self._flush_timer = None
+            nodes, self._dirty_nodes = self._dirty_nodes, False
+            log, self._dirty_log = self._dirty_log, False
+        try:
+            if nodes:
+                self._update_control(self.detected_nodes_list)
+            if log:
+                self._update_control(self.log_container)
+        except Exception as ex:
+            self.logger.debug(f"Error flushing NMT UI: {ex}")
+    
+    @staticmethod
+    def _update_control(control):
+        """Send only this control's subtree to the client (no-op until it is on a page)"""
+        if control is not None and control.page:
+            control.update()
+    
+    def update_detected_node(self, node_id: int, state: str, update: bool = True):
         """Update the detected nodes list"""
         try:
-            # Find if node already exists in list
-            node_found = False
-            for control in self.detected_nodes_list.controls[1:]:  # Skip header
-                if hasattr(control, 'data') and control.data == node_id:
-                    control.value = f"Node {node_id}: {state}"
-                    node_found = True
-                    break
-            
-            # If node not found, add it
-            if not node_found:
-                # Remove "No nodes detected" message if it exists
-                if len(self.detected_nodes_list.controls) == 2:
-                    if "No nodes detected" in self.detected_nodes_list.controls[1].value:
-                        self.detected_nodes_list.controls.pop()
+            # Update existing node entry
+            node_text = self._node_controls.get(node_id)
+            if node_text is not None:
+                node_text.value = f"Node {node_id}: {state}"
+            else:
+                # Remove "No nodes detected" message on the first detected node
+                if self._nodes_placeholder_active:
+                    self.detected_nodes_list.controls.pop(1)
+                    self._nodes_placeholder_active = False
                 
                 # Add new node entry
                 node_text = ft.Text(f"Node {node_id}: {state}")
                 node_text.data = node_id  # Store node ID for identification
                 self.detected_nodes_list.controls.append(node_text)
+                self._node_controls[node_id] = node_text
             
-            if self.page:
-                self.page.update()
+            if update:
+                self._update_control(self.detected_nodes_list)
                 
         except Exception as ex:
             self.logger.debug(f"Error updating detected nodes: {ex}")
     
-    def add_log_entry(self, message: str, color=ft.Colors.BLACK):
-        """Add entry to command log"""
+    def set_tab_visible(self, visible: bool, update: bool = True):
+        """Track NMT tab visibility; on reveal, turn log entries buffered while hidden into controls"""
         try:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            log_entry = ft.Text(f"[{timestamp}] {message}", color=color, size=12)
+            # Flag and drain change together, so an entry is either buffered before the drain
+            # or added as a control after it, in arrival order
+            with self._log_lock:
+                self._tab_visible = visible
+                if not visible or not self._pending_log:
+                    return
+                while self._pending_log:
+                    timestamp, message, color = self._pending_log.popleft()
+                    self._log_entries.append(ft.Text(f"[{timestamp}] {message}", color=color, size=12))
+                self.log_container.controls[1:] = self._log_entries
             
-            self.log_container.controls.append(log_entry)
-            
-            # Keep only last 20 entries (plus header)
-            if len(self.log_container.controls) > 21:
-                self.log_container.controls.pop(1)  # Remove oldest (skip header)
-            
-            if self.page:
-                self.page.update()
+            if update:
+                self._update_control(self.log_container)
                 
         except Exception as ex:
-            self.logger.debug(f"Error adding log entry: {ex}")
-            self.log_container.controls.pop(1)  # Remove oldest (skip header)
+            self.logger.debug(f"Error flushing buffered log entries: {ex}")
+    
+    def add_log_entry(self, message: str, color=ft.Colors.BLACK, update: bool = True) -> bool:
+        """Add entry to command log; returns False when it was buffered because the tab is hidden"""
+        try:
+            now = int(time.time())
+            second, timestamp = self._ts_cache
+            if second != now:
+                timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+                self._ts_cache = (now, timestamp)
+            
+            with self._log_lock:
+                # Tab hidden: keep the raw entry, no control is built until the tab is shown
+                if not self._tab_visible:
+                    self._pending_log.append((timestamp, message, color))
+                    return False
+                
+                log_entry = ft.Text(f"[{timestamp}] {message}", color=color, size=12)
+                
+                # Keep only last 20 entries (plus header); the deque evicts the oldest
+                self._log_entries.append(log_entry)
+                self.log_container.controls[1:] = self._log_entries
             
-            if self.page:
-                self.page.update()
+            if update:
+                self._update_control(self.log_container)
+            return True
                 
         except Exception as ex:
             self.logger.debug(f"Error adding log entry: {ex}")
+            return False
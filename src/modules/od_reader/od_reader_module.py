@@ -1,10 +1,17 @@
 import flet as ft
 from typing import Any
+import functools
 import os
+import threading
 from .panels.left_panel import LeftPanel
 from .panels.right_panel import RightPanel
 from utils import od_c_parser
 
+# Parse results are keyed by (path, mtime, size) so reloading an unchanged file skips parsing
+@functools.lru_cache(maxsize=8)
+def _cached_parse(file_path: str, mtime_ns: int, size: int):
+    return od_c_parser.parse_od_c_full(file_path)
+
 class ODReaderModule(ft.Column):
     def __init__(self, page: ft.Page, config: Any, logger: Any):
         super().__init__()
@@ -16,6 +23,18 @@ class ODReaderModule(ft.Column):
         self.variables_module = None  # Reference to variables module
         self.monitor_module = None  # Reference to monitor module
         self.graph_module = None  # Reference to graph module
+        self._pending_load = False  # Saved OD file not parsed yet (deferred until first needed)
+        self._loaded_key = None  # (path, mtime_ns, size) of the OD file currently applied
+
+        # Save feedback snack bars, reused on every click
+        self._err_snack = ft.SnackBar(
+            content=ft.Text("No configuration to save. Please load an OD.c file first."),
+            bgcolor=ft.Colors.RED_400
+        )
+        self._ok_snack = ft.SnackBar(
+            content=ft.Text("Configuration saved successfully!"),
+            bgcolor=ft.Colors.GREEN_400
+        )
 
         # Create panels
         self.left_panel = LeftPanel(self)
@@ -51,8 +70,8 @@ class ODReaderModule(ft.Column):
         self.left_panel.initialize()
         self.right_panel.initialize()
 
-        # Load saved OD file path if exists
-        self.load_saved_path()
+        # Defer loading the saved OD file until a tab that uses it is opened
+        self._pending_load = bool(getattr(self.config, 'od_file_path', None))
 
     def load_od_file(self, e):
         """Handle OD file loading"""
@@ -71,23 +90,49 @@ class ODReaderModule(ft.Column):
             allowed_extensions=["c"]
         )
 
-    def load_od_c_file(self, file_path: str):
-        """Load and parse OD.c file using od_c_parser.py"""
+    def load_od_c_file(self, file_path: str, update: bool = True):
+        """Load and parse OD.c file using od_c_parser.py; parsing runs on a worker thread"""
         try:
-            # Use centralized parser for variables
-            results = od_c_parser.parse_od_c(file_path)
-            self.registers = []
-            for reg in results:
-                # reg should be a dict with index, name, dataLength, category, dataType
-                self.registers.append(reg)
-
-            # Extract PDO mappings
-            try:
-                self.pdo_mappings = od_c_parser.parse_pdo_mappings(file_path)
-                self.logger.info(f"Extracted {len(self.pdo_mappings['rpdos'])} RPDOs and {len(self.pdo_mappings['tpdos'])} TPDOs")
-            except Exception as e:
-                self.logger.warning(f"Could not extract PDO mappings: {e}")
-                self.pdo_mappings = {'rpdos': [], 'tpdos': []}
+            st = os.stat(file_path)
+            if self.registers and self._loaded_key == (file_path, st.st_mtime_ns, st.st_size):
+                self.logger.debug(f"OD.c file unchanged, skipping reload: {file_path}")
+                return
+        except OSError:
+            pass  # Reported by the worker
+
+        self.left_panel.update_status("Loading OD.c file...", ft.Colors.BLUE)
+        if update and self.page:
+            self.page.update()
+
+        threading.Thread(target=self._parse_worker, args=(file_path,), daemon=True).start()
+
+    def _parse_worker(self, file_path: str):
+        """Parse the OD.c file off the UI thread, then hand the results to _apply_results"""
+        try:
+            # Use centralized parser for variables and PDO mappings (single read of the file)
+            st = os.stat(file_path)
+            file_key = (file_path, st.st_mtime_ns, st.st_size)
+            results, pdo_mappings = _cached_parse(*file_key)
+        except Exception as ex:
+            self._apply_error(ex)
+            return
+        self._apply_results(file_path, results, pdo_mappings, file_key)
+
+    def _apply_error(self, ex: Exception):
+        """Report a failed OD.c load in the left panel"""
+        self.logger.error(f"Error loading OD.c file: {ex}", exc_info=True)
+        self.left_panel.update_status(f"Error loading file: {str(ex)}", ft.Colors.RED)
+        if self.page:
+            self.page.update()
+
+    def _apply_results(self, file_path: str, results, pdo_mappings, file_key=None):
+        """Store parsed OD.c data, refresh the panels and notify dependent modules"""
+        try:
+            # Column-oriented RegisterTable; iterating it yields dicts with index, name, data_length, category
+            self.registers = results
+            self.pdo_mappings = pdo_mappings
+            self._loaded_key = file_key
+            self.logger.info(f"Extracted {len(self.pdo_mappings['rpdos'])} RPDOs and {len(self.pdo_mappings['tpdos'])} TPDOs")
 
             # Save file path to config
             self.config.od_file_path = file_path
@@ -97,25 +142,22 @@ class ODReaderModule(ft.Column):
             self.left_panel.update_file_info(os.path.basename(file_path))
             self.left_panel.update_status("OD.c file loaded successfully", ft.Colors.GREEN)
             self.left_panel.update_summary(len(self.registers))
-            self.right_panel.update_content(self.registers)
             
             # Notify variables module if available - with better error handling
             if self.variables_module:
                 try:
                     self.logger.info("Notifying variables module of new OD data")
-                    self.variables_module.load_od_variables(self)
+                    self.variables_module.load_od_variables(self, update=False)
                     self.logger.info("Successfully notified variables module of new OD data")
                 except Exception as e:
-                    self.logger.error(f"Error notifying variables module: {e}")
-                    import traceback
-                    self.logger.error(traceback.format_exc())
+                    self.logger.error(f"Error notifying variables module: {e}", exc_info=True)
             else:
                 self.logger.warning("Variables module reference not set")
             
             # Notify monitor module if available
             if self.monitor_module:
                 try:
-                    self.monitor_module.load_od_data(self)
+                    self.monitor_module.load_od_data(self, update=False)
                     self.logger.info("Notified monitor module of new OD data")
                 except Exception as e:
                     self.logger.warning(f"Could not notify monitor module: {e}")
@@ -123,46 +165,33 @@ class ODReaderModule(ft.Column):
             # Notify graph module if available
             if self.graph_module:
                 try:
-                    self.graph_module.load_od_data(self)
+                    self.graph_module.load_od_data(self, update=False)
                     self.logger.info("Notified graph module of new OD data")
                 except Exception as e:
                     self.logger.warning(f"Could not notify graph module: {e}")
 
-            # Force page update
-            if self.page:
-                self.page.update()
+            # Rendered on the next frame so back-to-back loads only rebuild the list once; that
+            # render sends the single page update for all panels and notified modules
+            self.right_panel.schedule_update_content(self.registers)
 
         except Exception as ex:
-            self.logger.error(f"Error loading OD.c file: {ex}")
-            import traceback
-            self.logger.error(traceback.format_exc())
-            self.left_panel.update_status(f"Error loading file: {str(ex)}", ft.Colors.RED)
-            if self.page:
-                self.page.update()
+            self._apply_error(ex)
 
     def save_configuration(self, e):
         """Save configuration to file"""
-        if not self.registers:
-            self.page.show_snack_bar(
-                ft.SnackBar(
-                    content=ft.Text("No configuration to save. Please load an OD.c file first."),
-                    bgcolor=ft.Colors.RED_400
-                )
-            )
-            return
+        self.page.open(self._ok_snack if self.registers else self._err_snack)
 
-        self.page.show_snack_bar(
-            ft.SnackBar(
-                content=ft.Text("Configuration saved successfully!"),
-                bgcolor=ft.Colors.GREEN_400
-            )
-        )
+    def ensure_loaded(self, update: bool = True):
+        """Load the saved OD file the first time its data is needed"""
+        if self._pending_load:
+            self._pending_load = False
+            self.load_saved_path(update=update)
 
-    def load_saved_path(self):
+    def load_saved_path(self, update: bool = True):
         """Load saved OD file path from config"""
         if hasattr(self.config, 'od_file_path') and self.config.od_file_path:
             if os.path.exists(self.config.od_file_path):
-                self.load_od_c_file(self.config.od_file_path)
+                self.load_od_c_file(self.config.od_file_path, update=update)
 
     def save_path_to_config(self):
         """Save OD file path to config"""
@@ -177,16 +206,14 @@ class ODReaderModule(ft.Column):
     def set_variables_module(self, variables_module):
         """Set reference to variables module for notifications"""
         self.variables_module = variables_module
-        # For now, we just store it in the config object
-        pass
-
-    def get_registers_for_export(self):
-        """Get registers list for use by other modules"""
-        return self.registers
-    
-    def set_variables_module(self, variables_module):
-        """Set reference to variables module for notifications"""
-        self.variables_module = variables_module
+        self.logger.info("Variables module reference set")
+        # If we already have registers loaded, notify the variables module immediately
+        if self.registers:
+            try:
+                self.variables_module.load_od_variables(self)
+                self.logger.info("Loaded existing OD data into variables module")
+            except Exception as e:
+                self.logger.warning(f"Could not load existing OD data into variables module: {e}")
 
     def set_monitor_module(self, monitor_module):
         """Set reference to monitor module for notifications"""
@@ -212,14 +239,6 @@ class ODReaderModule(ft.Column):
             except Exception as e:
                 self.logger.warning(f"Could not load existing OD data into graph module: {e}")
 
-    def get_registers_for_export(self):
-        """Get registers list for use by other modules"""
-        return self.registers
-
-    def set_variables_module(self, variables_module):
-        """Set reference to variables module for notifications"""
-        self.variables_module = variables_module
-
     def get_pdo_mappings(self):
         """Get PDO mappings for use by other modules"""
         return self.pdo_mappings
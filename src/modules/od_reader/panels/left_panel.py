@@ -12,50 +12,49 @@ class LeftPanel(ft.Column):
         self.status_text = ft.Text("Ready to load OD.c file", color=ft.Colors.BLUE)
         self.summary_text = ft.Text("No registers loaded", size=12, color=ft.Colors.GREY_600)
 
-    def initialize(self):
-        """Initialize the left panel"""
-        # Create summary and device info cards
-        self.summary_card = ft.Card(
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Text("Summary", size=14, weight=ft.FontWeight.BOLD),
-                    ft.Divider(height=1),
-                    self.summary_text
-                ], spacing=8),
-                padding=12
-            ),
-            elevation=1
-        )
-        
+        # Full-summary lines (XML summaries); created once, only their values change
+        self._sum_file = ft.Text("", size=11, visible=False)
+        self._sum_objects = ft.Text("", size=11, visible=False)
+        self._sum_communication = ft.Text("", size=11, visible=False)
+        self._sum_manufacturer = ft.Text("", size=11, visible=False)
+        self._sum_device_profile = ft.Text("", size=11, visible=False)
+        self._summary_lines = [self._sum_file, self._sum_objects, self._sum_communication,
+                               self._sum_manufacturer, self._sum_device_profile]
+
+        # Device identity lines
         self.device_info_content = ft.Text("No device information available", size=12, color=ft.Colors.GREY_600)
-        device_info_card = ft.Card(
+        self._dev_vendor = ft.Text("", size=11, visible=False)
+        self._dev_product = ft.Text("", size=11, visible=False)
+        self._dev_version = ft.Text("", size=11, visible=False)
+        self._dev_vendor_id = ft.Text("", size=11, visible=False)
+        self._device_lines = [self._dev_vendor, self._dev_product, self._dev_version, self._dev_vendor_id]
+
+    @staticmethod
+    def _build_card(title: str, *controls) -> ft.Card:
+        """Build a titled card with the panel's standard layout"""
+        return ft.Card(
             content=ft.Container(
                 content=ft.Column([
-                    ft.Text("Device Information", size=14, weight=ft.FontWeight.BOLD),
+                    ft.Text(title, size=14, weight=ft.FontWeight.BOLD),
                     ft.Divider(height=1),
-                    self.device_info_content
+                    *controls
                 ], spacing=8),
                 padding=12
             ),
             elevation=1
         )
+
+    def initialize(self):
+        """Initialize the left panel"""
+        # Create summary and device info cards
+        self.summary_card = self._build_card("Summary", self.summary_text, *self._summary_lines)
+        device_info_card = self._build_card("Device Information", self.device_info_content, *self._device_lines)
+        file_card = self._build_card("OD.c File Selection", self.load_button, self.file_path_text, self.status_text)
         
         self.controls = [
             ft.Container(
                 content=ft.Column([
-                    ft.Card(
-                        content=ft.Container(
-                            content=ft.Column([
-                                ft.Text("OD.c File Selection", size=14, weight=ft.FontWeight.BOLD),
-                                ft.Divider(height=1),
-                                self.load_button,
-                                self.file_path_text,
-                                self.status_text
-                            ], spacing=8),
-                            padding=12
-                        ),
-                        elevation=1
-                    ),
+                    file_card,
                     self.summary_card,
                     device_info_card,
                     ft.Container(
@@ -91,6 +90,9 @@ class LeftPanel(ft.Column):
             # Handle simple register count from OD.c parser
             self.summary_text.value = f"📊 Total registers: {summary}"
             self.summary_text.color = ft.Colors.GREEN
+            self.summary_text.visible = True
+            for line in self._summary_lines:
+                line.visible = False
             return
             
         if not summary:  # Handle None or empty summary
@@ -100,45 +102,24 @@ class LeftPanel(ft.Column):
             
         device_info = summary.get('device_info', {})
         
-        # Update summary card
-        summary_content = [
-            ft.Text("Summary", size=14, weight=ft.FontWeight.BOLD),
-            ft.Divider(height=1),
-            ft.Text(f"📁 {os.path.basename(summary.get('xml_file', 'Unknown'))}", size=11),
-            ft.Text(f"📊 Objects: {summary.get('total_objects', 0)}", size=11),
-            ft.Text(f"🔧 Communication: {summary.get('communication_params', 0)}", size=11),
-            ft.Text(f"🏭 Manufacturer: {summary.get('manufacturer_params', 0)}", size=11),
-            ft.Text(f"⚙️ Device Profile: {summary.get('device_profile_params', 0)}", size=11),
-        ]
-        
-        self.summary_card.content = ft.Container(
-            content=ft.Column(summary_content, spacing=6),
-            padding=12
-        )
+        # Update summary lines in place
+        self.summary_text.visible = False
+        self._sum_file.value = f"📁 {os.path.basename(summary.get('xml_file', 'Unknown'))}"
+        self._sum_objects.value = f"📊 Objects: {summary.get('total_objects', 0)}"
+        self._sum_communication.value = f"🔧 Communication: {summary.get('communication_params', 0)}"
+        self._sum_manufacturer.value = f"🏭 Manufacturer: {summary.get('manufacturer_params', 0)}"
+        self._sum_device_profile.value = f"⚙️ Device Profile: {summary.get('device_profile_params', 0)}"
+        for line in self._summary_lines:
+            line.visible = True
         
         # Update device information
-        if device_info and 'device_identity' in device_info:
+        has_identity = bool(device_info) and 'device_identity' in device_info
+        if has_identity:
             identity = device_info['device_identity']
-            self.device_info_content = ft.Column([
-                ft.Text(f"Vendor: {identity.get('vendorName', 'Unknown')}", size=11),
-                ft.Text(f"Product: {identity.get('productName', 'Unknown')}", size=11),
-                ft.Text(f"Version: {identity.get('productNumber', 'Unknown')}", size=11),
-                ft.Text(f"Vendor ID: {identity.get('vendorNumber', 'Unknown')}", size=11),
-            ], spacing=6)
-            
-            # Update device info in the card
-            try:
-                main_container = self.controls[0]  # The scrollable container
-                device_card = main_container.content.controls[2]  # Third card in the scrollable column
-                device_card.content.content.controls[2] = self.device_info_content
-            except (IndexError, AttributeError) as e:
-                print(f"Warning: Could not update device info card: {e}")
-        else:
-            self.device_info_content = ft.Text("No device information available", size=12, color=ft.Colors.GREY_600)
-            try:
-                main_container = self.controls[0]  # The scrollable container
-                device_card = main_container.content.controls[2]  # Third card in the scrollable column
-                device_card.content.content.controls[2] = self.device_info_content
-            except (IndexError, AttributeError) as e:
-                print(f"Warning: Could not update device info card: {e}")
-                print(f"Warning: Could not update device info card: {e}")
+            self._dev_vendor.value = f"Vendor: {identity.get('vendorName', 'Unknown')}"
+            self._dev_product.value = f"Product: {identity.get('productName', 'Unknown')}"
+            self._dev_version.value = f"Version: {identity.get('productNumber', 'Unknown')}"
+            self._dev_vendor_id.value = f"Vendor ID: {identity.get('vendorNumber', 'Unknown')}"
+        self.device_info_content.visible = not has_identity
+        for line in self._device_lines:
+            line.visible = has_identity
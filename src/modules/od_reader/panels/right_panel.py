@@ -1,31 +1,42 @@
 import flet as ft
+from contextlib import contextmanager
+import threading
+from .virtual_list import VirtualListView
 
 class RightPanel(ft.Column):
+    # Seconds over which scheduled register updates are coalesced (one frame)
+    RENDER_BATCH_INTERVAL = 0.016
+    # Register list columns: (label, width); None takes the remaining width
+    REGISTER_COLUMNS = (("Index", 80), ("Name", None), ("Length (bytes)", 110), ("Category", 120))
+
     def __init__(self, parent_module):
         super().__init__()
         self.parent = parent_module
         self.registers = []
+        self._reg_view = []  # Register rows as (index, name, length, category) tuples
+        self._registers_fingerprint = None  # hash() of _reg_view, to skip no-op updates
+        self._update_depth = 0  # Nesting level of _batched_updates
+        # schedule_update_content state: latest registers and the timer that will render them
+        self._render_lock = threading.Lock()
+        self._pending_registers = None
+        self._render_timer = None
 
-        self.table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Index", size=10, weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Name", size=10, weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Length (bytes)", size=10, weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Category", size=10, weight=ft.FontWeight.BOLD)),
-            ],
-            rows=[],
-            heading_row_height=30,
-            data_row_min_height=25,
-            data_row_max_height=30
+        # Only the rows around the viewport exist as controls
+        self.table = VirtualListView(
+            column_widths=[width for _, width in self.REGISTER_COLUMNS],
+            expand=True
         )
+        self.table_header = self.table.build_header([label for label, _ in self.REGISTER_COLUMNS])
 
     def initialize(self):
-        """Initialize the right panel"""
+        """Initialize the right panel (the static layout is only built once)"""
+        if self.controls:
+            return
         self.controls = [
             ft.Text("Object Dictionary Registers", size=16, weight=ft.FontWeight.BOLD),
             ft.Divider(height=1),
             ft.Container(
-                content=ft.Column([self.table], scroll=ft.ScrollMode.AUTO),
+                content=ft.Column([self.table_header, ft.Divider(height=1), self.table], spacing=0, expand=True),
                 expand=True,
                 border=ft.border.all(1, ft.Colors.GREY_300),
                 border_radius=5,
@@ -34,24 +45,74 @@ class RightPanel(ft.Column):
         ]
         self.expand = True
 
-    def update_content(self, registers):
-        """Update table with new registers"""
-        self.registers = registers or []
-        self.table.rows.clear()
-        
-        for reg in self.registers:
-            self.table.rows.append(
-                ft.DataRow(cells=[
-                    ft.DataCell(ft.Text(reg['index'], size=10)),
-                    ft.DataCell(ft.Text(reg['name'], size=10)),
-                    ft.DataCell(ft.Text(str(reg['data_length']), size=10)),
-                    ft.DataCell(ft.Text(reg['category'], size=10)),
-                ])
-            )
-        
-        if hasattr(self.parent, 'page') and self.parent.page:
+    @contextmanager
+    def _batched_updates(self, update: bool = True):
+        """Group control changes; nested batches share the single page update sent by the outermost one"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and update:
+                self.force_flush()
+
+    def force_flush(self):
+        """Send pending control changes now, even inside a batch"""
+        if getattr(self.parent, 'page', None):
             self.parent.page.update()
+
+    def update_content(self, registers, update: bool = True):
+        """Update table with new registers (update=False leaves the page update to the caller)"""
+        registers = registers or []
+        rows = self._register_rows(registers)
+        fingerprint = hash(tuple(rows))
+        if fingerprint == self._registers_fingerprint:
+            # Same registers as the last call: nothing to rebuild or send
+            self.registers = registers
+            return
+        
+        with self._batched_updates(update):
+            self.registers = registers
+            self._registers_fingerprint = fingerprint
+            self._reg_view = rows
+            
+            # Same row count: only rewrite the rows whose values changed
+            old_rows = self.table.items
+            if old_rows and len(rows) == len(old_rows):
+                changed = [i for i, (new, old) in enumerate(zip(rows, old_rows)) if new != old]
+                self.table.replace_items(rows, changed, update=False)
+            else:
+                self.table.set_items(rows, update=False)
     
+    def schedule_update_content(self, registers):
+        """
+        Render registers on the next frame; calls within the same frame only render the latest list.
+        The render always sends one page update, which also carries the callers' pending changes.
+        """
+        with self._render_lock:
+            self._pending_registers = registers
+            if self._render_timer is None:
+                self._render_timer = threading.Timer(self.RENDER_BATCH_INTERVAL, self._flush_scheduled_content)
+                self._render_timer.daemon = True
+                self._render_timer.start()
+
+    def _flush_scheduled_content(self):
+        with self._render_lock:
+            registers = self._pending_registers
+            self._pending_registers = None
+            self._render_timer = None
+        self.update_content(registers, update=False)
+        self.force_flush()
+
+    @staticmethod
+    def _register_rows(registers) -> list:
+        """Tuple view of the registers, one (index, name, length, category) tuple per row"""
+        if hasattr(registers, 'columns'):
+            # RegisterTable: zip its parallel columns instead of building a dict per row
+            cols = registers.columns()
+            return list(zip(cols['index'], cols['name'], map(str, cols['data_length']), cols['category']))
+        return [(reg['index'], reg['name'], str(reg['data_length']), reg['category']) for reg in registers]
+
     def create_parameters_tables(self) -> ft.Container:
         """Create scrollable tables for manufacturer and device profile parameters"""
         if not self.parser:
@@ -0,0 +1,100 @@
+import flet as ft
+from typing import Optional, Sequence
+
+class VirtualListView(ft.ListView):
+    """
+    Fixed-row-height list that only keeps row controls for the rows around the viewport.
+    Rows outside the window are stood in for by two spacers, and a small pool of row
+    controls is refilled with new values as the user scrolls.
+    """
+
+    def __init__(self, column_widths: Sequence[Optional[int]], row_height: int = 28,
+                 window_rows: int = 40, overscan: int = 10, text_size: int = 10, **kwargs):
+        super().__init__(spacing=0, on_scroll=self._on_scroll, on_scroll_interval=50, **kwargs)
+        self.column_widths = list(column_widths)  # None = take the remaining width
+        self.row_height = row_height
+        self.window_rows = window_rows
+        self.overscan = overscan
+        self.text_size = text_size
+        self.items = ()  # Sequence of row tuples (one str per column)
+        self._first = 0  # Item index shown in the first pooled row
+        self._pool = []
+        self._top_spacer = ft.Container(height=0)
+        self._bottom_spacer = ft.Container(height=0)
+        self.controls = [self._top_spacer, self._bottom_spacer]
+
+    def build_header(self, labels: Sequence[str]) -> ft.Row:
+        """Build a bold header row aligned with the list columns"""
+        return ft.Row(
+            [
+                ft.Text(label, size=self.text_size, weight=ft.FontWeight.BOLD, width=width, expand=width is None)
+                for label, width in zip(labels, self.column_widths)
+            ],
+            height=self.row_height
+        )
+
+    def _make_row(self, _Text=ft.Text, _ellipsis=ft.TextOverflow.ELLIPSIS) -> ft.Row:
+        """One pooled row: a single-line Text per column"""
+        size = self.text_size
+        return ft.Row(
+            [
+                _Text("", size=size, width=width, expand=width is None, max_lines=1, overflow=_ellipsis)
+                for width in self.column_widths
+            ],
+            height=self.row_height
+        )
+
+    def set_items(self, items: Sequence[Sequence[str]], update: bool = True):
+        """Replace the rows shown by the list (update=False leaves the update to the caller)"""
+        self.items = items
+        self._render()
+        if update and self.page:
+            self.update()
+
+    def replace_items(self, items: Sequence[Sequence[str]], changed: Sequence[int], update: bool = True):
+        """Swap in items of the same length, rewriting only the changed rows inside the window"""
+        self.items = items
+        count = min(len(self._pool), len(items))
+        for i in changed:
+            slot = i - self._first
+            if 0 <= slot < count:
+                for text, value in zip(self._pool[slot].controls, items[i]):
+                    text.value = value
+        if update and self.page and changed:
+            self.update()
+
+    def _render(self):
+        """Fill the pooled rows with the current window and size the spacers around it"""
+        n = len(self.items)
+        count = min(self.window_rows, n)
+        if len(self._pool) < count:
+            make_row = self._make_row
+            self._pool.extend(make_row() for _ in range(count - len(self._pool)))
+            self.controls = [self._top_spacer, *self._pool, self._bottom_spacer]
+
+        first = max(0, min(self._first, n - count))
+        self._first = first
+        for slot, row in enumerate(self._pool):
+            if slot < count:
+                for text, value in zip(row.controls, self.items[first + slot]):
+                    text.value = value
+                row.visible = True
+            else:
+                row.visible = False
+
+        self._top_spacer.height = first * self.row_height
+        self._bottom_spacer.height = (n - first - count) * self.row_height
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        """Move the window when the viewport gets close to its edges"""
+        top = int(e.pixels // self.row_height)
+        visible = int((e.viewport_dimension or 0) // self.row_height) + 1
+        self.window_rows = max(self.window_rows, visible + 2 * self.overscan)
+
+        count = min(self.window_rows, len(self.items))
+        if self._first <= top and top + visible <= self._first + count and len(self._pool) >= count:
+            return
+
+        self._first = max(0, top - self.overscan)
+        self._render()
+        self.update()
@@ -3,15 +3,109 @@ SYNC Module - Manages SYNC message transmission as master
 """
 
 import flet as ft
+import errno
+import os
+import sys
 import threading
 import time
+from functools import partial
 from typing import Optional, Any
 from config.app_config import AppConfig
 from utils.logger import Logger
 
+# Sleeps shorter than this finish by spinning on perf_counter instead of time.sleep
+_SPIN_THRESHOLD = 0.002
+# Periods below this use high_precision_sleep between SYNC messages
+_PRECISE_PERIOD = 0.01
+# Counter display strings for every possible SYNC counter value (max counter is 240)
+_COUNTER_STRS = tuple(str(i) for i in range(241))
+
+def high_precision_sleep(seconds: float):
+    """Sleep coarsely until about _SPIN_THRESHOLD is left, then spin until the exact deadline"""
+    end = time.perf_counter() + seconds
+    coarse = seconds - _SPIN_THRESHOLD
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < end:
+        pass
+
+def _load_clock_nanosleep():
+    """
+    On Linux, return sleep_until(deadline): a kernel sleep until an absolute CLOCK_MONOTONIC
+    time through libc clock_nanosleep(TIMER_ABSTIME). None elsewhere or if libc lacks it.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        clock_nanosleep = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+
+    class _Timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+    clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.c_void_p]
+    clock_nanosleep.restype = ctypes.c_int
+    TIMER_ABSTIME = 1
+    clock_id = time.CLOCK_MONOTONIC
+    byref = ctypes.byref
+
+    def sleep_until(deadline: float):
+        seconds = int(deadline)
+        ts = _Timespec(seconds, int((deadline - seconds) * 1e9))
+        # Interrupted by a signal: sleep again, the absolute deadline is still valid
+        while clock_nanosleep(clock_id, TIMER_ABSTIME, byref(ts), None) == errno.EINTR:
+            pass
+
+    return sleep_until
+
+_sleep_until = _load_clock_nanosleep()
+
+def _set_windows_timer_resolution(enable: bool) -> bool:
+    """Request (or release) 1 ms system timer resolution on Windows; no-op elsewhere"""
+    if sys.platform != "win32":
+        return False
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        (winmm.timeBeginPeriod if enable else winmm.timeEndPeriod)(1)
+        return True
+    except (ImportError, AttributeError, OSError):
+        return False
+
+def _set_rt_priority(thread: threading.Thread):
+    """
+    Raise a started thread to real-time (Linux SCHED_FIFO) or time-critical (Windows)
+    priority. Raises OSError/AttributeError when not permitted or not supported.
+    """
+    tid = thread.native_id
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        THREAD_SET_INFORMATION = 0x0020
+        THREAD_PRIORITY_TIME_CRITICAL = 15
+        handle = kernel32.OpenThread(THREAD_SET_INFORMATION, False, tid)
+        if not handle:
+            raise OSError("OpenThread failed")
+        try:
+            if not kernel32.SetThreadPriority(handle, THREAD_PRIORITY_TIME_CRITICAL):
+                raise OSError("SetThreadPriority failed")
+        finally:
+            kernel32.CloseHandle(handle)
+    else:
+        os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(10))
+
 class SyncModule(ft.Column):
     """Module for managing SYNC message transmission"""
     
+    # Seconds between counter/statistics redraws while the service runs (20 Hz)
+    GUI_REFRESH_INTERVAL = 0.05
+    # Intervals (ms) from which SYNC is sent by a chain of threading.Timer instead of a worker thread
+    TIMER_CHAIN_MIN_INTERVAL = 100
+    
     def __init__(self, page: ft.Page, config: AppConfig, logger: Logger, interface_manager=None):
         super().__init__()
         self.page = page
@@ -26,9 +120,11 @@ class SyncModule(ft.Column):
         self.sync_counter = 0
         self.max_counter = 0  # Default max counter (0-240, then wraps to 1)
         self.sync_cob_id = 0x80  # Default SYNC COB-ID
+        self._timer_resolution_raised = False  # timeBeginPeriod(1) active (Windows)
         
         # GUI controls
         self.status_text = None
+        self.status_dot = None
         self.interval_field = None
         self.cob_id_field = None
         self.max_counter_field = None
@@ -42,6 +138,16 @@ class SyncModule(ft.Column):
         self.start_time = None
         self.last_send_time = None
         self.failed_sends = 0
+        # (sent, failed, last interval ms) published by the sending thread in one store;
+        # the GUI reads it whole, so the statistics text never mixes values of different sends
+        self._stats_snap = (0, 0, None)
+        self._stats_key = None  # Inputs of the cached statistics text
+        self._stats_text = ""
+        self._gui_dirty = threading.Event()  # Set by the worker, cleared by the GUI refresher
+        self._stop_event = threading.Event()  # Wakes the worker and refresher out of their waits on stop
+        self._worker_failed = False  # Worker exited on its own (error or lost interface); reaped by the refresher
+        # Makes start/stop check-and-set atomic and orders timer re-arming against stop
+        self._state_lock = threading.Lock()
         
     def initialize(self):
         """Initialize the SYNC module"""
@@ -58,6 +164,26 @@ class SyncModule(ft.Column):
             self.create_status_indicator()
         ])
         
+        # Configuration fields, kept as named references
+        self.cob_id_field = ft.TextField(
+            value=f"0x{self.sync_cob_id:03X}",
+            width=120,
+            hint_text="0x080",
+            on_change=self.on_cob_id_change
+        )
+        self.interval_field = ft.TextField(
+            value=str(self.sync_interval),
+            width=120,
+            hint_text="100",
+            on_change=self.on_interval_change
+        )
+        self.max_counter_field = ft.TextField(
+            value=str(self.max_counter),
+            width=120,
+            hint_text="240",
+            on_change=self.on_max_counter_change
+        )
+        
         # Configuration section
         config_card = ft.Card(
             content=ft.Container(
@@ -68,39 +194,21 @@ class SyncModule(ft.Column):
                     # SYNC COB-ID
                     ft.Row([
                         ft.Text("SYNC COB-ID:", width=120),
-                        ft.TextField(
-                            ref=ft.Ref[ft.TextField](),
-                            value=f"0x{self.sync_cob_id:03X}",
-                            width=120,
-                            hint_text="0x080",
-                            on_change=self.on_cob_id_change
-                        ),
+                        self.cob_id_field,
                         ft.Text("(Hex format, e.g., 0x080)")
                     ]),
                     
                     # SYNC Interval
                     ft.Row([
                         ft.Text("Interval (ms):", width=120),
-                        ft.TextField(
-                            ref=ft.Ref[ft.TextField](),
-                            value=str(self.sync_interval),
-                            width=120,
-                            hint_text="100",
-                            on_change=self.on_interval_change
-                        ),
+                        self.interval_field,
                         ft.Text("(1-10000 ms)")
                     ]),
                     
                     # Max Counter
                     ft.Row([
                         ft.Text("Max Counter:", width=120),
-                        ft.TextField(
-                            ref=ft.Ref[ft.TextField](),
-                            value=str(self.max_counter),
-                            width=120,
-                            hint_text="240",
-                            on_change=self.on_max_counter_change
-                        ),
+                        self.max_counter_field,
                         ft.Text("(0=no counter, 1-240)")
                     ]),
                 ]),
@@ -109,10 +217,24 @@ class SyncModule(ft.Column):
             )
         )
         
-        # Store references to controls
-        self.cob_id_field = config_card.content.content.controls[2].controls[1]
-        self.interval_field = config_card.content.content.controls[3].controls[1]
-        self.max_counter_field = config_card.content.content.controls[4].controls[1]
+        # Control buttons and counter display
+        self.start_stop_button = ft.ElevatedButton(
+            text="Start SYNC",
+            icon=ft.Icons.PLAY_ARROW,
+            on_click=self.toggle_sync_service
+        )
+        self.reset_button = ft.ElevatedButton(
+            text="Reset Counter",
+            icon=ft.Icons.REFRESH,
+            on_click=self.reset_counter,
+            disabled=False
+        )
+        self.counter_display = ft.Text(
+            str(self.sync_counter),
+            size=20,
+            weight=ft.FontWeight.BOLD,
+            color=ft.Colors.BLUE
+        )
         
         # Control section
         control_card = ft.Card(
@@ -123,20 +245,9 @@ class SyncModule(ft.Column):
                     
                     # Start/Stop button
                     ft.Row([
-                        ft.ElevatedButton(
-                            text="Start SYNC",
-                            icon=ft.Icons.PLAY_ARROW,
-                            on_click=self.toggle_sync_service,
-                            ref=ft.Ref[ft.ElevatedButton]()
-                        ),
+                        self.start_stop_button,
                         ft.Container(width=20),
-                        ft.ElevatedButton(
-                            text="Reset Counter",
-                            icon=ft.Icons.REFRESH,
-                            on_click=self.reset_counter,
-                            disabled=False,
-                            ref=ft.Ref[ft.ElevatedButton]()
-                        )
+                        self.reset_button
                     ]),
                     
                     ft.Container(height=10),
@@ -144,23 +255,16 @@ class SyncModule(ft.Column):
                     # Current counter display
                     ft.Row([
                         ft.Text("Current Counter:", weight=ft.FontWeight.BOLD),
-                        ft.Text(
-                            str(self.sync_counter),
-                            size=20,
-                            weight=ft.FontWeight.BOLD,
-                            color=ft.Colors.BLUE,
-                            ref=ft.Ref[ft.Text]()
-                        )
+                        self.counter_display
                     ]),
                 ]),
                 padding=15
             )
         )
         
-        # Store references
-        self.start_stop_button = control_card.content.content.controls[2].controls[0]
-        self.reset_button = control_card.content.content.controls[2].controls[2]
-        self.counter_display = control_card.content.content.controls[4].controls[1]
+        self.stats_text = ft.Text(
+            "SYNC messages sent: 0\nFailed sends: 0\nUptime: 0 seconds\nAvg rate: 0.0 msg/s\nLast interval: N/A"
+        )
         
         # Statistics section
         stats_card = ft.Card(
@@ -168,17 +272,12 @@ class SyncModule(ft.Column):
                 content=ft.Column([
                     ft.Text("Statistics", size=16, weight=ft.FontWeight.BOLD),
                     ft.Divider(),
-                    ft.Text(
-                        "SYNC messages sent: 0\nFailed sends: 0\nUptime: 0 seconds\nAvg rate: 0.0 msg/s\nLast interval: N/A",
-                        ref=ft.Ref[ft.Text]()
-                    )
+                    self.stats_text
                 ]),
                 padding=15
             )
         )
         
-        self.stats_text = stats_card.content.content.controls[2]
-        
         # Main layout
         self.controls = [
             title_row,
@@ -208,8 +307,10 @@ class SyncModule(ft.Column):
             weight=ft.FontWeight.BOLD
         )
         
+        self.status_dot = ft.Icon(ft.Icons.CIRCLE, size=12, color=ft.Colors.RED)
+        
         return ft.Row([
-            ft.Icon(ft.Icons.CIRCLE, size=12, color=ft.Colors.RED),
+            self.status_dot,
             self.status_text
         ])
     
@@ -275,11 +376,19 @@ class SyncModule(ft.Column):
             self.show_error("Interface not connected. Please connect to CAN interface first.")
             return
         
-        self.is_sync_active = True
+        with self._state_lock:
+            if self.is_sync_active:
+                return
+            self.is_sync_active = True
+            # Fresh event per run: timers and refreshers left over from a previous run keep the old, set one
+            self._stop_event = threading.Event()
+        self._worker_failed = False
         self.sync_count = 0
         self.failed_sends = 0
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.last_send_time = None
+        self._stats_snap = (0, 0, None)
+        self._stats_key = None
         
         # Update GUI
         self.start_stop_button.text = "Stop SYNC"
@@ -288,23 +397,52 @@ class SyncModule(ft.Column):
         self.status_text.color = ft.Colors.GREEN
         
         # Update status indicator
-        self.controls[0].controls[3].controls[0].color = ft.Colors.GREEN
+        self.status_dot.color = ft.Colors.GREEN
         
         # Disable configuration during operation
         self.cob_id_field.disabled = True
         self.interval_field.disabled = True
         self.max_counter_field.disabled = True
         
-        # Start SYNC thread
-        self.sync_thread = threading.Thread(target=self.sync_worker, daemon=True)
-        self.sync_thread.start()
+        # 1 ms timer granularity while the service runs (Windows default is ~15 ms)
+        self._timer_resolution_raised = _set_windows_timer_resolution(True)
+        
+        if self.sync_interval >= self.TIMER_CHAIN_MIN_INTERVAL:
+            # Low rate: one short-lived timer per message instead of a thread sleeping in between
+            self._schedule_next_sync(time.perf_counter(), self._stop_event)
+        else:
+            # Start SYNC thread
+            self.sync_thread = threading.Thread(target=self.sync_worker, daemon=True)
+            self.sync_thread.start()
+            try:
+                _set_rt_priority(self.sync_thread)
+            except (OSError, AttributeError) as e:
+                # Usually missing privileges; SYNC still runs at normal priority
+                self.logger.debug(f"Could not raise SYNC thread priority: {e}")
+        threading.Thread(target=self._gui_refresh_worker, daemon=True).start()
         
         self.logger.info(f"SYNC service started - COB-ID: 0x{self.sync_cob_id:03X}, Interval: {self.sync_interval}ms")
         self.page.update()
     
     def stop_sync_service(self):
-        """Stop the SYNC service"""
-        self.is_sync_active = False
+        """Stop the SYNC service and wait for the worker to exit (safe to call more than once)"""
+        # Only one caller (Stop button, refresher reaping a failed worker, cleanup) gets past here
+        with self._state_lock:
+            if not self.is_sync_active:
+                return
+            self.is_sync_active = False
+            self._stop_event.set()
+            worker, self.sync_thread = self.sync_thread, None
+        
+        if isinstance(worker, threading.Timer):
+            worker.cancel()  # Pending low-rate send; joined below in case it is already sending
+        if worker and worker is not threading.current_thread():
+            # Bounded: a send in progress finishes before the interface can be torn down
+            worker.join(timeout=max(0.05, 2 * self.sync_interval / 1000.0))
+        
+        if self._timer_resolution_raised:
+            _set_windows_timer_resolution(False)
+            self._timer_resolution_raised = False
         
         # Update GUI
         self.start_stop_button.text = "Start SYNC"
@@ -313,7 +451,7 @@ class SyncModule(ft.Column):
         self.status_text.color = ft.Colors.RED
         
         # Update status indicator
-        self.controls[0].controls[3].controls[0].color = ft.Colors.RED
+        self.status_dot.color = ft.Colors.RED
         
         # Enable configuration
         self.cob_id_field.disabled = False
@@ -321,60 +459,134 @@ class SyncModule(ft.Column):
         self.max_counter_field.disabled = False
         
         self.logger.info("SYNC service stopped")
+        # Final counter/statistics values, sent with the same page update
+        self.update_statistics()  # Worker has exited: publish counts it changed after its last send
+        self._gui_dirty.clear()
+        if self.stats_text and self.start_time:
+            self.counter_display.value = _COUNTER_STRS[self.sync_counter]
+            self.stats_text.value = self.format_statistics()
         self.page.update()
     
     def sync_worker(self):
         """Worker thread for sending SYNC messages"""
         self.logger.info("Starting SYNC worker thread")
-        while self.is_sync_active:
+        # Absolute deadlines: send time, logging and GUI work don't accumulate as drift.
+        # With clock_nanosleep they live in the CLOCK_MONOTONIC domain it sleeps against.
+        sleep_until = _sleep_until
+        now = partial(time.clock_gettime, time.CLOCK_MONOTONIC) if sleep_until else time.perf_counter
+        next_deadline = now() + self.sync_interval / 1000.0
+        stop_event = self._stop_event
+        
+        # Bound once per run: COB-ID and max counter fields are locked while the service runs
+        send = self.interface_manager.send_sync_message
+        record_send = self._record_send
+        cob_id = self.sync_cob_id
+        use_counter = self.max_counter > 0
+        
+        while not stop_event.is_set():
             
             try:
-                current_time = time.time()
+                current_time = now()
                 
                 # Send SYNC message through interface manager
-                success = False
-                if self.interface_manager and self.interface_manager.is_connected():
-                    if self.max_counter > 0:
-                        success = self.interface_manager.send_sync_message(self.sync_cob_id, self.sync_counter)
-                    else:
-                        success = self.interface_manager.send_sync_message(self.sync_cob_id, None)
+                if use_counter:
+                    success = send(cob_id, self.sync_counter)
                 else:
-                    self.logger.warning("Interface disconnected during SYNC transmission")
-                    self.stop_sync_service()
+                    success = send(cob_id, None)
+                
+                if not record_send(success, current_time):
                     break
                 
-                if success:
-                    self.sync_count += 1
-                    # self.logger.debug(f"SYNC sent - COB-ID: 0x{self.sync_cob_id:03X}, Counter: {self.sync_counter if self.max_counter > 0 else 'None'}")
-                    
-                    # Update counter
-                    self.update_sync_counter()
-                else:
+                # Wait for the next deadline (period re-read so interval changes apply)
+                period = self.sync_interval / 1000.0
+                remaining = next_deadline - now()
+                if remaining > 0:
+                    if period < _PRECISE_PERIOD:
+                        # Short waits can't be interrupted; stop joins for longer than one
+                        if sleep_until:
+                            sleep_until(next_deadline)
+                        else:
+                            high_precision_sleep(remaining)
+                    elif stop_event.wait(remaining):
+                        break
+                next_deadline += period
+                if remaining < -period:
+                    # More than a period behind: resync instead of bursting to catch up
                     self.failed_sends += 1
-                    self.logger.warning(f"Failed to send SYNC message - COB-ID: 0x{self.sync_cob_id:03X}")
-                
-                # Calculate actual interval for statistics
-                if self.last_send_time:
-                    actual_interval = (current_time - self.last_send_time) * 1000
-                else:
-                    actual_interval = self.sync_interval
-                
-                self.last_send_time = current_time
-                
-                # Update statistics
-                self.update_statistics(actual_interval)
-                
-                # Wait for next interval
-                time.sleep(self.sync_interval / 1000.0)
+                    next_deadline = now() + period
                 
             except Exception as e:
                 self.logger.error(f"Error in SYNC worker: {e}")
                 self.failed_sends += 1
                 break
         
-        # If we exit the loop due to error, stop the service
-        if self.is_sync_active:
-            self.stop_sync_service()
+        # Exited on its own (error or lost interface): the GUI refresher stops the service
+        if not stop_event.is_set():
+            self._worker_failed = True
+    
+    def _record_send(self, success: bool, current_time: float) -> bool:
+        """Count one SYNC send and record its interval; False once the interface is gone"""
+        if success:
+            self.sync_count += 1
+            # self.logger.debug(f"SYNC sent - COB-ID: 0x{self.sync_cob_id:03X}, Counter: {self.sync_counter if self.max_counter > 0 else 'None'}")
+            
+            # Update counter
+            self.update_sync_counter()
+        elif not self.interface_manager.is_connected():
+            # Connection state is only consulted once a send has failed
+            self.logger.warning("Interface disconnected during SYNC transmission")
+            return False
+        else:
+            self.failed_sends += 1
+            self.logger.warning(f"Failed to send SYNC message - COB-ID: 0x{self.sync_cob_id:03X}")
+        
+        # Calculate actual interval for statistics
+        if self.last_send_time:
+            actual_interval = (current_time - self.last_send_time) * 1000
+        else:
+            actual_interval = self.sync_interval
+        
+        self.last_send_time = current_time
+        
+        # Update statistics
+        self.update_statistics(actual_interval)
+        return True
+    
+    def _schedule_next_sync(self, deadline: float, stop_event: threading.Event):
+        """Arm a timer sending the next low-rate SYNC message at deadline (perf_counter time)"""
+        timer = threading.Timer(max(0.0, deadline - time.perf_counter()), self._send_once,
+                                args=(deadline, stop_event))
+        timer.daemon = True
+        # Under the lock so stop either sees this timer or this run's stop event is already set
+        with self._state_lock:
+            if not stop_event.is_set():
+                self.sync_thread = timer
+                timer.start()
+    
+    def _send_once(self, deadline: float, stop_event: threading.Event):
+        """Timer callback: send one SYNC message and schedule the next from the same deadline grid"""
+        if stop_event.is_set():
+            return
+        try:
+            current_time = time.perf_counter()
+            counter = self.sync_counter if self.max_counter > 0 else None
+            success = self.interface_manager.send_sync_message(self.sync_cob_id, counter)
+            if not self._record_send(success, current_time):
+                self._worker_failed = True
+                return
+        except Exception as e:
+            self.logger.error(f"Error in SYNC timer: {e}")
+            self.failed_sends += 1
+            self._worker_failed = True
+            return
+        
+        period = self.sync_interval / 1000.0
+        next_deadline = deadline + period
+        if time.perf_counter() - next_deadline > period:
+            # More than a period behind: resync instead of bursting to catch up
+            self.failed_sends += 1
+            next_deadline = time.perf_counter() + period
+        self._schedule_next_sync(next_deadline, stop_event)
     
     def prepare_sync_message(self) -> dict:
         """Prepare SYNC message data"""
@@ -390,61 +602,77 @@ class SyncModule(ft.Column):
         }
     
     def update_sync_counter(self):
-        """Update SYNC counter value"""
+        """Update SYNC counter value (the display is redrawn by the GUI refresher)"""
         if self.max_counter > 0:
             self.sync_counter += 1
             if self.sync_counter > self.max_counter:
                 self.sync_counter = 1  # Wrap to 1, not 0
-        
-        # Update GUI counter display (thread-safe update)
-        def update_gui():
-            if self.counter_display:
-                self.counter_display.value = str(self.sync_counter)
-                # self.page.update()
-        
-        # Schedule GUI update on main thread
-        try:
-            self.page.run_thread(update_gui)
-        except:
-            # Fallback if run_thread is not available
-            pass
+        self._gui_dirty.set()
     
     def reset_counter(self, e):
         """Reset SYNC counter to 0"""
         self.sync_counter = 0
         if self.counter_display:
-            self.counter_display.value = str(self.sync_counter)
+            self.counter_display.value = _COUNTER_STRS[self.sync_counter]
             self.page.update()
         self.logger.info("SYNC counter reset")
     
     def update_statistics(self, actual_interval=None):
-        """Update statistics display"""
-        if not self.stats_text or not self.start_time:
-            return
-            
-        uptime = time.time() - self.start_time
-        avg_rate = self.sync_count / uptime if uptime > 0 else 0
-        
-        interval_text = f"{actual_interval:.1f} ms" if actual_interval else "N/A"
-        
-        stats_text = (
-            f"SYNC messages sent: {self.sync_count}\n"
-            f"Failed sends: {self.failed_sends}\n"
+        """Publish a statistics snapshot (interval kept if None); the text is redrawn by the GUI refresher"""
+        if actual_interval is None:
+            actual_interval = self._stats_snap[2]
+        self._stats_snap = (self.sync_count, self.failed_sends, actual_interval)
+        self._gui_dirty.set()
+    
+    def format_statistics(self) -> str:
+        """Statistics text for the current counters, reused while none of its values changed"""
+        uptime = time.perf_counter() - self.start_time
+        sync_count, failed_sends, last_interval = self._stats_snap
+        # Rounded as displayed, so the key changes exactly when the visible text would
+        key = (sync_count, failed_sends, round(uptime, 1),
+               round(last_interval, 1) if last_interval else None)
+        if key == self._stats_key:
+            return self._stats_text
+        
+        avg_rate = sync_count / uptime if uptime > 0 else 0
+        
+        interval_text = f"{last_interval:.1f} ms" if last_interval else "N/A"
+        
+        self._stats_key = key
+        self._stats_text = (
+            f"SYNC messages sent: {sync_count}\n"
+            f"Failed sends: {failed_sends}\n"
             f"Uptime: {uptime:.1f} seconds\n"
             f"Avg rate: {avg_rate:.1f} msg/s\n"
             f"Last interval: {interval_text}"
         )
-        
-        # Thread-safe GUI update
-        def update_stats_gui():
-            self.stats_text.value = stats_text
-            # self.page.update()
-        
+        return self._stats_text
+    
+    def _gui_refresh_worker(self):
+        """Redraw counter and statistics at a fixed rate, independent of the SYNC rate"""
+        stop_event = self._stop_event  # This run's event, replaced on the next start
+        while not stop_event.wait(self.GUI_REFRESH_INTERVAL):
+            if self._worker_failed:
+                self.stop_sync_service()
+                break
+            if self._gui_dirty.is_set():
+                self._gui_dirty.clear()
+                self.refresh_gui()
+    
+    def refresh_gui(self):
+        """Write counter and statistics into their controls with a single page update"""
+        if not self.stats_text or not self.start_time:
+            return
         try:
-            self.page.run_thread(update_stats_gui)
-        except:
-            # Fallback if run_thread is not available
-            self.stats_text.value = stats_text
+            counter = _COUNTER_STRS[self.sync_counter]
+            stats = self.format_statistics()
+            if stats is self.stats_text.value and counter is self.counter_display.value:
+                return  # Nothing visible changed since the last redraw
+            self.counter_display.value = counter
+            self.stats_text.value = stats
+            self.page.update()
+        except Exception as e:
+            self.logger.debug(f"Error refreshing SYNC display: {e}")
     
     def show_error(self, message: str):
         """Show error dialog"""
@@ -465,5 +693,4 @@ class SyncModule(ft.Column):
     
     def cleanup(self):
         """Cleanup when module is destroyed"""
-        if self.is_sync_active:
-            self.stop_sync_service()
+        self.stop_sync_service()
@@ -1,8 +1,14 @@
 import flet as ft
+import threading
+from bisect import bisect_left
+from collections import defaultdict
 from .tracked_variable import TrackedVariable
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class LeftPanel(ft.Column):
+    # Seconds of typing pause before the search filter runs
+    SEARCH_DEBOUNCE = 0.12
+
     def __init__(self, parent_module):
         super().__init__()
         self.parent = parent_module
@@ -10,6 +16,14 @@ class LeftPanel(ft.Column):
         self.available_variables = []
         self.filtered_variables = []
         self.selected_variable = None
+        self._filter_timer: Optional[threading.Timer] = None  # Pending debounced search
+        self._tile_pool = []  # ListTiles reused across list updates
+        # Guards filtered_variables, the tile pool and variables_list.controls: the debounced
+        # search and the category dropdown handler can run on different threads
+        self._list_lock = threading.RLock()
+        # Search index over available_variables (see _build_search_index)
+        self._by_category = {}
+        self._sorted_keys = []
 
         # Controls
         self.category_filter = None
@@ -41,7 +55,7 @@ class LeftPanel(ft.Column):
             width=220,
             label="Search variables",
             hint_text="Enter variable name or index",
-            on_change=self.filter_variables,
+            on_change=self.on_search_change,
             
         )
         
@@ -90,7 +104,7 @@ class LeftPanel(ft.Column):
             od_module = self.variables_module.get_od_reader_module()
             
             if od_module and hasattr(od_module, "registers") and od_module.registers:
-                self.load_variables_from_od(od_module)
+                self.load_variables_from_od(od_module, update=False)
                 self.status_text.value = "Refreshed from OD Reader module"
                 self.status_text.color = ft.Colors.GREEN
                 
@@ -128,9 +142,13 @@ class LeftPanel(ft.Column):
         if hasattr(self.variables_module, 'page') and self.variables_module.page:
             self.variables_module.page.update()
 
-    def load_variables_from_od(self, od_module_or_registers):
-        """Load variables from OD.c registers - accepts either od_module or registers list"""
+    def load_variables_from_od(self, od_module_or_registers, update: bool = True):
+        """
+        Load variables from OD.c registers - accepts either od_module or registers list
+        (update=False leaves the page update to the caller)
+        """
         self.available_variables.clear()
+        self._build_search_index()
         
         # Handle both od_module object and direct registers list
         if hasattr(od_module_or_registers, 'registers'):
@@ -149,56 +167,114 @@ class LeftPanel(ft.Column):
             self.status_text.color = ft.Colors.RED
             return
         
-        for reg in registers:
-            # Handle both 'dataLength' and 'data_length' keys
-            data_length = reg.get('data_length', reg.get('dataLength', 1))
-            
-            var = TrackedVariable(
-                index=reg['index'],
-                name=reg['name'],
-                category=reg['category'],
-                data_length=data_length
-            )
-            self.available_variables.append(var)
+        # Handle both 'dataLength' and 'data_length' keys, decided once from the first row
+        length_key = 'data_length' if 'data_length' in registers[0] else 'dataLength'
+        from_reg = TrackedVariable.from_reg
+        self.available_variables.extend([from_reg(reg, length_key) for reg in registers])
         
+        self._build_search_index()
         self.status_text.value = f"Loaded {len(self.available_variables)} variables"
         self.status_text.color = ft.Colors.GREEN
-        self.filter_variables(None)
+        self.filter_variables(None, update=False)
         
         # Force UI update
-        if hasattr(self.variables_module, 'page') and self.variables_module.page:
+        if update and getattr(self.variables_module, 'page', None):
             self.variables_module.page.update()
 
-    def filter_variables(self, e):
-        """Filter variables based on category and search"""
-        category = self.category_filter.value if self.category_filter else "All"
-        search_text = self.search_field.value.lower() if self.search_field and self.search_field.value else ""
+    def _build_search_index(self):
+        """Category buckets and sorted (lowercase key, position) pairs over available_variables"""
+        by_category = defaultdict(list)
+        keys = []
+        for i, var in enumerate(self.available_variables):
+            by_category[var.category].append(i)
+            keys.append((var._name_lc, i))
+            keys.append((var._index_lc, i))
+        keys.sort()
+        self._by_category = dict(by_category)
+        self._sorted_keys = keys
+
+    def on_search_change(self, e):
+        """Debounce search input: filter once typing pauses for SEARCH_DEBOUNCE seconds"""
+        if self._filter_timer:
+            self._filter_timer.cancel()
+        self._filter_timer = threading.Timer(self.SEARCH_DEBOUNCE, self._dispatch_search_filter)
+        self._filter_timer.daemon = True
+        self._filter_timer.start()
+
+    def _dispatch_search_filter(self):
+        """Debounce timer callback: run the filter through the page like any other event handler"""
+        page = self.variables_module.page
+        if page:
+            page.run_thread(self.filter_variables, None)
+        else:
+            self.filter_variables(None)
+
+    def filter_variables(self, e, update: bool = True):
+        """
+        Filter variables based on category and search. Names and indexes starting with the
+        search text are found by bisecting the sorted keys; only when nothing starts with it
+        are variables containing it anywhere listed. update=False leaves the page update to
+        the caller.
+        """
+        with self._list_lock:
+            category = self.category_filter.value if self.category_filter else "All"
+            search_text = (self.search_field.value or "").lower().strip() if self.search_field else ""
+            all_categories = category == "All"
+            variables = self.available_variables
         
-        self.filtered_variables = []
-        for var in self.available_variables:
-            if category != "All" and var.category != category:
-                continue
-            if search_text and search_text not in var.name.lower() and search_text not in var.index.lower():
-                continue
-            self.filtered_variables.append(var)
-        
-        self.update_variables_list()
+            if not search_text:
+                if all_categories:
+                    self.filtered_variables = list(variables)
+                else:
+                    self.filtered_variables = [variables[i] for i in self._by_category.get(category, ())]
+            else:
+                keys = self._sorted_keys
+                lo = bisect_left(keys, (search_text,))
+                hi = bisect_left(keys, (search_text + "\uffff",), lo)
+                matches = {i for _, i in keys[lo:hi]}
+                if not all_categories:
+                    matches.intersection_update(self._by_category.get(category, ()))
+            
+                if matches:
+                    self.filtered_variables = [variables[i] for i in sorted(matches)]
+                else:
+                    self.filtered_variables = [
+                        var for var in variables
+                        if (all_categories or var.category == category)
+                        and (search_text in var._name_lc or search_text in var._index_lc)
+                    ]
+        
+            self.update_variables_list(update)
 
-    def update_variables_list(self):
-        """Update the variables list display"""
-        self.variables_list.controls.clear()
-        
-        for var in self.filtered_variables:
-            list_item = ft.ListTile(
-                title=ft.Text(var.name, size=13),
-                subtitle=ft.Text(f"{var.index} - {var.category} - {var.data_length} bytes", size=12),
-                on_click=lambda e, v=var: self.select_variable(v),
-                bgcolor=ft.Colors.BLUE_50 if var == self.selected_variable else None
-            )
-            self.variables_list.controls.append(list_item)  # Agregar el item a la lista
+    def update_variables_list(self, update: bool = True):
+        """Update the variables list display, rewriting pooled tiles in place (update=False leaves the page update to the caller)"""
+        with self._list_lock:
+            pool = self._tile_pool
+            pooled = len(pool)
+            selected = self.selected_variable
         
-        if self.variables_module.page:
-            self.variables_module.page.update()
+            for i, var in enumerate(self.filtered_variables):
+                subtitle = f"{var.index} - {var.category} - {var.data_length} bytes"
+                bgcolor = ft.Colors.BLUE_50 if var == selected else None
+                if i < pooled:
+                    tile = pool[i]
+                    tile.title.value = var.name
+                    tile.subtitle.value = subtitle
+                    tile.data = var
+                    tile.bgcolor = bgcolor
+                else:
+                    pool.append(ft.ListTile(
+                        title=ft.Text(var.name, size=13),
+                        subtitle=ft.Text(subtitle, size=12),
+                        data=var,
+                        on_click=self._on_tile_click,
+                        bgcolor=bgcolor
+                    ))
+        
+            self.variables_list.controls = pool[:len(self.filtered_variables)]
+        
+            if update and self.variables_module.page:
+                self.variables_module.page.update()
     
     def _add_object_variables(self, obj: Dict[str, Any], category: str):
         """Add object and its sub-objects to available variables - DISABLED for od_c_parser"""
@@ -207,11 +283,15 @@ class LeftPanel(ft.Column):
         pass
 
     
+    def _on_tile_click(self, e):
+        """Shared click handler of the variable tiles; each tile carries its variable in data"""
+        self.select_variable(e.control.data)
+
     def select_variable(self, variable: TrackedVariable):
         """Select a variable for addition"""
         self.selected_variable = variable
         self.add_button.disabled = False
-        self.update_variables_list()
+        self.update_variables_list(update=False)
         if self.variables_module.page:
             self.variables_module.page.update()
 
@@ -11,6 +11,14 @@ class TrackedVariable:
         self.last_update = None
         self.update_count = 0
 
+    @classmethod
+    def from_reg(cls, reg: dict, length_key: str = 'data_length') -> "TrackedVariable":
+        """Create from an OD.c register row, with the lowercase search keys precomputed"""
+        var = cls(reg['index'], reg['name'], reg['category'], reg.get(length_key, 1))
+        var._name_lc = var.name.lower()
+        var._index_lc = str(var.index).lower()
+        return var
+
     def update_value(self, value: Any):
         """Update variable value from CAN message"""
         self.current_value = str(value)
@@ -119,24 +119,22 @@ class VariablesModule(ft.Column):
                 registers.append(reg_copy)
             self.left_panel.load_variables_from_od(registers)
     
-    def load_od_variables(self, od_module):
+    def load_od_variables(self, od_module, update: bool = True):
         """Load variables from OD reader module (using registers list) - called by OD Reader"""
         try:
             self.logger.info("Loading variables from OD Reader module")
             
             # Use the left panel's load method which handles the data properly
-            self.left_panel.load_variables_from_od(od_module)
+            self.left_panel.load_variables_from_od(od_module, update=False)
             
             # Force UI update
-            if self.page:
+            if update and self.page:
                 self.page.update()
                 
             self.logger.info(f"Successfully loaded {len(self.left_panel.available_variables)} variables from OD Reader")
             
         except Exception as e:
-            self.logger.error(f"Error loading variables from OD module: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"Error loading variables from OD module: {e}", exc_info=True)
     
     def on_message_received(self, message: CANMessage):
         """Process received CAN messages to update variable values"""
@@ -46,9 +46,9 @@ class Logger:
         """Log warning message"""
         self.logger.warning(message)
     
-    def error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
+    def error(self, message: str, exc_info: bool = False):
+        """Log error message (exc_info=True appends the current traceback)"""
+        self.logger.error(message, exc_info=exc_info)
     
     def critical(self, message: str):
         """Log critical message"""
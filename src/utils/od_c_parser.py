@@ -1,4 +1,93 @@
 import re
+from array import array
+from collections.abc import Sequence
+
+class RegisterTable(Sequence):
+    """
+    Registros del OD.c almacenados por columnas (index, name, data_length, category).
+    Iterar o indexar devuelve un dict nuevo por fila para los consumidores existentes.
+    """
+    __slots__ = ('index', 'name', 'data_length', 'category')
+
+    def __init__(self):
+        self.index = []
+        self.name = []
+        self.data_length = array('I')
+        self.category = []
+
+    def append(self, index, name, data_length, category):
+        self.index.append(index)
+        self.name.append(name)
+        self.data_length.append(data_length)
+        self.category.append(category)
+
+    def _row(self, i):
+        return {
+            'index': self.index[i],
+            'name': self.name[i],
+            'data_length': self.data_length[i],
+            'category': self.category[i],
+        }
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        return self._row(i)
+
+    def __iter__(self):
+        for index, name, data_length, category in zip(self.index, self.name, self.data_length, self.category):
+            yield {'index': index, 'name': name, 'data_length': data_length, 'category': category}
+
+    def columns(self):
+        """Devuelve las columnas como dict de listas paralelas"""
+        return {
+            'index': self.index,
+            'name': self.name,
+            'data_length': self.data_length,
+            'category': self.category,
+        }
+
+class ODCParser:
+    """
+    Longitudes de datos del OD.c por índice, usadas por ODXMLParser para fijar el tamaño
+    definitivo de los objetos del XML. El OD.c solo da dataLength por índice, no por subíndice.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.registers = parse_od_c(filepath)
+        # "2000" -> dataLength en bytes
+        self._lengths = {
+            index[2:].upper(): length
+            for index, length in zip(self.registers.index, self.registers.data_length)
+        }
+
+    @staticmethod
+    def _normalize_index(index):
+        index = str(index).upper()
+        if index.startswith('0X'):
+            index = index[2:]
+        return index.zfill(4)
+
+    def get_data_length(self, index, sub_index=None):
+        """Longitud en bytes del índice, o None si no está en el OD.c (o se pide un subíndice)"""
+        if sub_index is not None:
+            return None
+        return self._lengths.get(self._normalize_index(index))
+
+    def get_data_length_bits(self, index, sub_index=None):
+        """Longitud en bits del índice, o None si no está en el OD.c (o se pide un subíndice)"""
+        length = self.get_data_length(index, sub_index)
+        return length * 8 if length is not None else None
+
+    def get_summary(self):
+        return {
+            'od_c_file': self.filepath,
+            'total_registers': len(self.registers),
+        }
 
 def get_category(index_hex):
     idx = int(index_hex, 16)
@@ -16,7 +105,12 @@ def get_category(index_hex):
 def parse_od_c(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
+    return parse_od_c_content(content)
 
+def parse_od_c_content(content):
+    """
+    Extrae los registros (variables) de un OD.c ya leído en memoria
+    """
     # Regex para encontrar bloques de variables .o_xxxx_nombre = { ... }
     pattern = re.compile(
         r'\.o_([0-9A-Fa-f]{4})_([a-zA-Z0-9_]+)\s*=\s*\{([^}]+)\}',
@@ -25,24 +119,15 @@ def parse_od_c(filepath):
 
     # Regex para encontrar dataLength = valor
     data_length_pattern = re.compile(r'\.dataLength\s*=\s*([0-9]+)')
-    # Regex para encontrar dataType = "tipo"
-    data_type_pattern = re.compile(r'\.dataType\s*=\s*"([^"]+)"')
 
-    results = []
-    for match in pattern.finditer(content):
-        index_hex = match.group(1)
-        name = match.group(2)
-        block = match.group(3)
-        data_length_match = data_length_pattern.search(block)
-        data_type_match = data_type_pattern.search(block)
+    results = RegisterTable()
+    # Locales para evitar búsquedas de atributos dentro del bucle
+    append = results.append
+    search_data_length = data_length_pattern.search
+    for index_hex, name, block in pattern.findall(content):
+        data_length_match = search_data_length(block)
         if data_length_match:
-            data_length = int(data_length_match.group(1))
-            results.append({
-                'index': f"0x{index_hex}",
-                'name': name,
-                'data_length': data_length,
-                'category': get_category(index_hex),
-            })
+            append(f"0x{index_hex}", name, int(data_length_match.group(1)), get_category(index_hex))
     return results
 
 def parse_application_object(app_obj_value):
@@ -238,7 +323,12 @@ def parse_pdo_mappings(filepath):
     """
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
-    
+    return parse_pdo_mappings_content(content)
+
+def parse_pdo_mappings_content(content):
+    """
+    Extrae los mapeos de PDOs de un OD.c ya leído en memoria
+    """
     # Parsear parámetros de comunicación y mapeo
     rpdo_comm, tpdo_comm = parse_pdo_communication_parameters(content)
     rpdo_map, tpdo_map = parse_pdo_mapping_parameters(content)
@@ -289,6 +379,14 @@ def parse_pdo_mappings(filepath):
     
     return complete_mappings
 
+def parse_od_c_full(filepath):
+    """
+    Lee el OD.c una sola vez y devuelve (registros, mapeos de PDOs)
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return parse_od_c_content(content), parse_pdo_mappings_content(content)
+
 def debug_pdo_mappings(filepath):
     """
     Función de debugging para mostrar los mapeos extraídos
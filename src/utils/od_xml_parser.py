@@ -1,4 +1,7 @@
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 from typing import Dict, List, Any, Optional
 import re
 from .od_c_parser import ODCParser
@@ -14,6 +17,9 @@ class ODXMLParser:
         self.manufacturer_params = {}
         self.device_profile_params = {}
         self.pdo_mappings = {}
+        self._pdo_objects = {}  # int index -> object, PDO comm/mapping params (0x1400-0x1BFF)
+        self._summary_cache = None  # get_summary() result, reset on every parse
+        self._pdo_mappings_cache = None  # extract_pdo_mappings() result, reset on every parse
         self.od_c_parser = None
         
         # Initialize OD.c parser if file is provided
@@ -28,24 +34,50 @@ class ODXMLParser:
     def load_xml(self):
         """Load and parse the XML file"""
         try:
-            self.tree = ET.parse(self.xml_file_path)
-            self.root = self.tree.getroot()
             self.parse_objects()
         except Exception as e:
             raise Exception(f"Error loading XML file: {e}")
     
     def parse_objects(self):
-        """Parse all CANopen objects from XML"""
-        canopen_list = self.root.find('CANopenObjectList')
-        if canopen_list is None:
-            raise Exception("No CANopenObjectList found in XML")
+        """Parse all CANopen objects from XML in a single streaming pass"""
+        self._summary_cache = None
+        self._pdo_mappings_cache = None
+        canopen_list = None
+        root = None
+        depth = 0  # Nesting depth of the element being parsed (root = 1)
+        in_list = False
+        for event, elem in ET.iterparse(self.xml_file_path, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                elif depth == 2 and canopen_list is None and elem.tag == 'CANopenObjectList':
+                    canopen_list = elem
+                    in_list = True
+                continue
+            
+            depth -= 1  # Now the depth of elem's parent
+            if elem is canopen_list:
+                in_list = False
+                continue
+            # Only direct CANopenObject children of the object list, as root.find() would return
+            if not in_list or depth != 2 or elem.tag != 'CANopenObject':
+                continue
             
-        for obj in canopen_list.findall('CANopenObject'):
-            index = obj.get('index')
+            index = elem.get('index')
             if index:
-                parsed_obj = self._parse_object(obj)
+                parsed_obj = self._parse_object(elem)
                 self.objects[index] = parsed_obj
                 self._categorize_object(index, parsed_obj)
+            
+            # Drop the processed object so memory stays flat; the rest of the
+            # document (e.g. 'other' used by get_device_info) is kept
+            elem.clear()
+            canopen_list.remove(elem)
+        
+        self.root = root
+        if canopen_list is None:
+            raise Exception("No CANopenObjectList found in XML")
     
     def _parse_object(self, obj_element) -> Dict[str, Any]:
         """Parse individual CANopen object"""
@@ -105,6 +137,9 @@ class ODXMLParser:
         # Communication parameters (0x1000-0x1FFF)
         if 0x1000 <= index_int <= 0x1FFF:
             self.communication_params[index] = obj_data
+            # PDO communication/mapping parameters, captured during the parse pass
+            if 0x1400 <= index_int <= 0x1BFF:
+                self._pdo_objects[index_int] = obj_data
             
         # Manufacturer parameters (0x2000-0x5FFF)
         elif 0x2000 <= index_int <= 0x5FFF:
@@ -115,23 +150,20 @@ class ODXMLParser:
             self.device_profile_params[index] = obj_data
     
     def extract_pdo_mappings(self):
-        """Extract PDO mapping information, grouping mapped parameters by index"""
+        """Extract PDO mapping information, grouping mapped parameters by index (computed once per parse)"""
+        if self._pdo_mappings_cache is not None:
+            return self._pdo_mappings_cache
+        
         rpdo_mappings = {}
         tpdo_mappings = {}
 
+        pdo_objects = self._pdo_objects
+
         # Extract RPDO communication parameters (0x1400-0x15FF)
-        rpdo_comm_params = {}
-        for index, obj in self.communication_params.items():
-            index_int = int(index, 16)
-            if 0x1400 <= index_int <= 0x15FF:
-                rpdo_comm_params[index] = obj
+        rpdo_comm_params = {i: obj for i, obj in pdo_objects.items() if 0x1400 <= i <= 0x15FF}
 
         # Extract TPDO communication parameters (0x1800-0x19FF)
-        tpdo_comm_params = {}
-        for index, obj in self.communication_params.items():
-            index_int = int(index, 16)
-            if 0x1800 <= index_int <= 0x19FF:
-                tpdo_comm_params[index] = obj
+        tpdo_comm_params = {i: obj for i, obj in pdo_objects.items() if 0x1800 <= i <= 0x19FF}
 
         # Helper to group mapped objects by index
         def group_by_index(mapped_objects):
@@ -153,37 +185,36 @@ class ODXMLParser:
             return list(grouped.values())
 
         # Extract RPDO mapping parameters (0x1600-0x17FF)
-        for index, obj in self.communication_params.items():
+        for index_int, obj in pdo_objects.items():
             try:
-                index_int = int(index, 16)
                 if 0x1600 <= index_int <= 0x17FF:
                     pdo_num = index_int - 0x1600
-                    mapping = self._parse_pdo_mapping(obj, rpdo_comm_params.get(f"{0x1400 + pdo_num:04X}"))
+                    mapping = self._parse_pdo_mapping(obj, rpdo_comm_params.get(0x1400 + pdo_num))
                     if mapping and 'mapped_objects' in mapping:  # Check if mapping is valid
                         # Agrupa los mapped_objects por index
                         mapping['mapped_parameters'] = group_by_index(mapping.get('mapped_objects', []))
                         rpdo_mappings[f"RPDO{pdo_num + 1}"] = mapping
             except Exception as e:
-                print(f"Error extracting RPDO mapping for {index}: {e}")
+                print(f"Error extracting RPDO mapping for {obj['index']}: {e}")
 
         # Extract TPDO mapping parameters (0x1A00-0x1BFF)
-        for index, obj in self.communication_params.items():
+        for index_int, obj in pdo_objects.items():
             try:
-                index_int = int(index, 16)
                 if 0x1A00 <= index_int <= 0x1BFF:
                     pdo_num = index_int - 0x1A00
-                    mapping = self._parse_pdo_mapping(obj, tpdo_comm_params.get(f"{0x1800 + pdo_num:04X}"))
+                    mapping = self._parse_pdo_mapping(obj, tpdo_comm_params.get(0x1800 + pdo_num))
                     if mapping and 'mapped_objects' in mapping:  # Check if mapping is valid
                         # Agrupa los mapped_objects por index
                         mapping['mapped_parameters'] = group_by_index(mapping.get('mapped_objects', []))
                         tpdo_mappings[f"TPDO{pdo_num + 1}"] = mapping
             except Exception as e:
-                print(f"Error extracting TPDO mapping for {index}: {e}")
+                print(f"Error extracting TPDO mapping for {obj['index']}: {e}")
 
         self.pdo_mappings = {
             'RPDO': rpdo_mappings,
             'TPDO': tpdo_mappings
         }
+        self._pdo_mappings_cache = self.pdo_mappings
 
         return self.pdo_mappings
     
@@ -426,7 +457,10 @@ class ODXMLParser:
         return enhanced_info
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get summary of parsed OD"""
+        """Get summary of parsed OD (computed once per parse)"""
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         summary = {
             'total_objects': len(self.objects),
             'communication_params': len(self.communication_params),
@@ -442,4 +476,5 @@ class ODXMLParser:
             od_c_summary = self.od_c_parser.get_summary()
             summary['od_c_summary'] = od_c_summary if od_c_summary is not None else {}
         
+        self._summary_cache = summary
         return summary
\ No newline at end of file
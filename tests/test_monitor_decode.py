@@ -0,0 +1,61 @@
+import logging
+
+import pytest
+
+from modules.monitor_module import MonitorModule, _ALIGNED_DECODERS
+
+COB_ID = 0x181
+
+
+def make_monitor(padding_bits, bit_length):
+    """Monitor with one PDO: an unwatched padding variable followed by 0x2000"""
+    monitor = MonitorModule(page=None, config=None, logger=logging.getLogger(__name__), interface_manager=object())
+    mapped = [{'index': '0x2000', 'bit_length': bit_length}]
+    if padding_bits:
+        mapped.insert(0, {'index': '0x2001', 'bit_length': padding_bits})
+    monitor.cob_id_to_pdo = {COB_ID: {'pdo_info': {'mapped_variables': mapped}}}
+    monitor.pdo_variables = {'0x2000': {'value': None}}
+    monitor.build_pdo_decode_plans()
+    return monitor
+
+
+@pytest.mark.parametrize("bit_length", [8, 16, 32])
+@pytest.mark.parametrize("fill", [0x5A, 0xA5], ids=["sign-clear", "sign-set"])
+@pytest.mark.parametrize("padding_bits", [0, 8, 16])
+def test_aligned_decoder_matches_extract_bits(bit_length, fill, padding_bits):
+    monitor = make_monitor(padding_bits, bit_length)
+    (plan,) = monitor.pdo_decode_plans[COB_ID]
+    var_index, decoder, byte_start, byte_end, bit_offset, length = plan
+
+    assert var_index == '0x2000'
+    assert decoder is _ALIGNED_DECODERS[bit_length]
+    assert (byte_start, bit_offset, length) == (padding_bits // 8, padding_bits, bit_length)
+
+    # Distinct bytes so a wrong offset or byte order shows up; the top byte carries the fill
+    size = bit_length // 8
+    value_bytes = bytes(range(1, size)) + bytes([fill])
+    raw = bytes([0xEE] * byte_start) + value_bytes + b"\xEE"
+
+    expected = int.from_bytes(value_bytes, "little", signed=False)
+    assert decoder(raw, byte_start)[0] == expected
+    assert MonitorModule._extract_bits(list(raw), byte_start, byte_end, bit_offset, bit_length) == expected
+
+
+@pytest.mark.parametrize("bit_length", [8, 16, 32])
+@pytest.mark.parametrize("padding_bits", [1, 4, 12])
+def test_unaligned_offsets_fall_back_to_extract_bits(bit_length, padding_bits):
+    monitor = make_monitor(padding_bits, bit_length)
+    (plan,) = monitor.pdo_decode_plans[COB_ID]
+    _, decoder, byte_start, byte_end, bit_offset, _ = plan
+
+    assert decoder is None
+    assert (byte_start, bit_offset) == (padding_bits // 8, padding_bits)
+    assert byte_end == (padding_bits + bit_length - 1) // 8
+
+
+def test_unwatched_variables_are_skipped():
+    monitor = make_monitor(8, 16)
+    monitor.pdo_variables = {}
+    monitor.build_pdo_decode_plans()
+
+    assert monitor.pdo_decode_plans == {}
@@ -0,0 +1,50 @@
+import logging
+from datetime import datetime
+
+import pytest
+
+from modules.monitor_module import MonitorModule
+
+
+@pytest.fixture
+def monitor():
+    return MonitorModule(page=None, config=None, logger=logging.getLogger(__name__), interface_manager=object())
+
+
+@pytest.mark.parametrize("microsecond, expected", [
+    (0, "12:34:56.000"),
+    (7_000, "12:34:56.007"),
+    (7_999, "12:34:56.007"),
+    (999_999, "12:34:56.999"),
+])
+def test_sub_second_formatting(monitor, microsecond, expected):
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 12, 34, 56, microsecond)) == expected
+
+
+def test_prefix_reused_within_the_same_second(monitor):
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 12, 0, 0, 1_000)) == "12:00:00.001"
+    cached = monitor._ts_prefix_cache
+
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 12, 0, 0, 500_000)) == "12:00:00.500"
+    assert monitor._ts_prefix_cache is cached
+
+
+def test_prefix_updates_at_second_boundary(monitor):
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 12, 0, 0, 999_000)) == "12:00:00.999"
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 12, 0, 1, 0)) == "12:00:01.000"
+    assert monitor._ts_prefix_cache == (12 * 3600 + 1, "12:00:01")
+
+
+@pytest.mark.parametrize("before, after, expected", [
+    (datetime(2024, 1, 1, 12, 0, 59, 999_000), datetime(2024, 1, 1, 12, 1, 0), "12:01:00.000"),
+    (datetime(2024, 1, 1, 23, 59, 59, 999_000), datetime(2024, 1, 2, 0, 0, 0), "00:00:00.000"),
+])
+def test_prefix_updates_on_minute_and_midnight_rollover(monitor, before, after, expected):
+    monitor._format_timestamp(before)
+    assert monitor._format_timestamp(after) == expected
+
+
+def test_same_second_on_another_day_reuses_prefix(monitor):
+    # The cache is keyed by second of day, and the prefix only holds HH:MM:SS
+    assert monitor._format_timestamp(datetime(2024, 1, 1, 8, 15, 30, 100_000)) == "08:15:30.100"
+    assert monitor._format_timestamp(datetime(2024, 1, 2, 8, 15, 30, 200_000)) == "08:15:30.200"
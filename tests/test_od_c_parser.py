@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from utils import od_c_parser
+from utils.od_c_parser import RegisterTable
+
+# Two OD.c variables plus RPDO1/TPDO1 communication and mapping parameters
+SAMPLE_OD_C = """
+OD_ATTR_OD OD_t *OD = {
+    .o_1017_producerHeartbeatTime = {
+        .dataOrig = &OD_PERSIST_COMM.x1017_producerHeartbeatTime,
+        .attribute = ODA_SDO_RW | ODA_MB,
+        .dataLength = 2
+    },
+    .o_2000_co_power_on_counter = {
+        .dataOrig = &OD_RAM.x2000_co_power_on_counter,
+        .attribute = ODA_SDO_RW | ODA_TPDO | ODA_MB,
+        .dataLength = 4
+    },
+    .x1400_RPDOCommunicationParameter = {
+        .highestSub_indexSupported = 0x05,
+        .COB_IDUsedByRPDO = 0x00000201,
+        .transmissionType = 0x01
+    },
+    .x1600_RPDOMappingParameter = {
+        .numberOfMappedApplicationObjectsInPDO = 0x02,
+        .applicationObject1 = 0x20000020,
+        .applicationObject2 = 0x10170010
+    },
+    .x1800_TPDOCommunicationParameter = {
+        .highestSub_indexSupported = 0x06,
+        .COB_IDUsedByTPDO = 0x40000181,
+        .transmissionType = 0xFE
+    },
+    .x1A00_TPDOMappingParameter = {
+        .numberOfMappedApplicationObjectsInPDO = 0x01,
+        .applicationObject1 = 0x20000020
+    },
+};
+"""
+
+
+@pytest.fixture
+def od_c_path(tmp_path):
+    path = tmp_path / "OD.c"
+    path.write_text(SAMPLE_OD_C, encoding="utf-8")
+    return str(path)
+
+
+BUNDLED_OD_C = os.path.join(os.path.dirname(__file__), os.pardir, "src", "utils", "OD.c")
+
+
+def test_register_table_sequence_protocol(od_c_path):
+    registers = od_c_parser.parse_od_c(od_c_path)
+
+    assert isinstance(registers, RegisterTable)
+    assert len(registers) == 2
+    assert registers[0] == {
+        'index': '0x1017', 'name': 'producerHeartbeatTime', 'data_length': 2, 'category': 'Communication'
+    }
+    assert registers[-1]['index'] == '0x2000'
+    assert registers[0:2] == list(registers)
+    assert [reg['name'] for reg in registers] == ['producerHeartbeatTime', 'co_power_on_counter']
+    assert bool(RegisterTable()) is False
+
+
+def test_register_table_rows_are_fresh_dicts(od_c_path):
+    registers = od_c_parser.parse_od_c(od_c_path)
+
+    row = registers[1]
+    row['name'] = 'changed'
+    assert registers[1]['name'] == 'co_power_on_counter'
+    assert all(isinstance(reg, dict) for reg in registers)
+
+
+def test_register_table_data_length_round_trip(od_c_path):
+    registers = od_c_parser.parse_od_c(od_c_path)
+
+    assert [reg['data_length'] for reg in registers] == [2, 4]
+    assert all(type(reg['data_length']) is int for reg in registers)
+
+    copy = RegisterTable()
+    for reg in registers:
+        copy.append(reg['index'], reg['name'], reg['data_length'], reg['category'])
+    assert list(copy) == list(registers)
+    assert list(copy.columns()['data_length']) == [2, 4]
+
+
+@pytest.mark.parametrize("path", ["fixture", BUNDLED_OD_C])
+def test_parse_od_c_full_matches_two_call_path(path, od_c_path):
+    if path == "fixture":
+        path = od_c_path
+
+    registers, mappings = od_c_parser.parse_od_c_full(path)
+
+    assert list(registers) == list(od_c_parser.parse_od_c(path))
+    assert mappings == od_c_parser.parse_pdo_mappings(path)
+    assert mappings['rpdos'] and mappings['tpdos']
+
+
+def test_parse_od_c_full_links_fixture_pdos(od_c_path):
+    _, mappings = od_c_parser.parse_od_c_full(od_c_path)
+
+    (rpdo,) = mappings['rpdos']
+    assert rpdo['cob_id_clean'] == 0x201
+    assert [(var['index'], var['bit_length']) for var in rpdo['mapped_variables']] == [
+        ('0x2000', 32), ('0x1017', 16)
+    ]
+    (tpdo,) = mappings['tpdos']
+    assert tpdo['cob_id_clean'] == 0x181
+    assert tpdo['num_mapped_variables'] == 1
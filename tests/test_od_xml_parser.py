@@ -0,0 +1,163 @@
+import pytest
+
+from utils.od_xml_parser import ODXMLParser
+
+# Minimal CANopenEditor XML: one communication, manufacturer and device profile object,
+# RPDO1 communication/mapping parameters, and an 'other' section after the object list
+SAMPLE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<device>
+  <CANopenObjectList>
+    <CANopenObject index="1000" name="Device type" objectType="VAR" dataType="0x07" accessType="ro" defaultValue="0x00000001" disabled="false">
+      <description>Device profile number</description>
+    </CANopenObject>
+    <CANopenObject index="1400" name="RPDO communication parameter" objectType="RECORD" subNumber="3">
+      <CANopenSubObject subIndex="00" name="Highest sub-index supported" dataType="0x05" defaultValue="0x02" />
+      <CANopenSubObject subIndex="01" name="COB-ID used by RPDO" dataType="0x07" defaultValue="0x00000200" />
+      <CANopenSubObject subIndex="02" name="Transmission type" dataType="0x05" defaultValue="254" />
+    </CANopenObject>
+    <CANopenObject index="1600" name="RPDO mapping parameter" objectType="RECORD" subNumber="3">
+      <CANopenSubObject subIndex="00" name="Number of mapped application objects in PDO" dataType="0x05" defaultValue="2" />
+      <CANopenSubObject subIndex="01" name="Application object 1" dataType="0x07" defaultValue="0x20000010" />
+      <CANopenSubObject subIndex="02" name="Application object 2" dataType="0x07" defaultValue="0x60000008" />
+    </CANopenObject>
+    <CANopenObject index="2000" name="Motor speed" objectType="VAR" dataType="0x06" accessType="rw" PDOmapping="RPDO" defaultValue="0" />
+    <CANopenObject index="6000" name="Digital inputs" objectType="VAR" dataType="0x05" accessType="ro" PDOmapping="optional" defaultValue="0" />
+  </CANopenObjectList>
+  <other>
+    <file fileName="sample.xml" fileVersion="1" />
+    <DeviceIdentity>
+      <vendorName>ACME</vendorName>
+    </DeviceIdentity>
+  </other>
+</device>
+"""
+
+# OD.c entry overriding the XML size of 0x2000 (UNSIGNED16 in the XML, 4 bytes here)
+SAMPLE_OD_C = """
+    .o_2000_motor_speed = {
+        .dataOrig = &OD_RAM.x2000_motor_speed,
+        .attribute = ODA_SDO_RW | ODA_RPDO,
+        .dataLength = 4
+    },
+"""
+
+
+@pytest.fixture
+def xml_path(tmp_path):
+    path = tmp_path / "sample.xml"
+    path.write_text(SAMPLE_XML, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def od_c_path(tmp_path):
+    path = tmp_path / "OD.c"
+    path.write_text(SAMPLE_OD_C, encoding="utf-8")
+    return str(path)
+
+
+def test_single_pass_parse_categorizes_objects(xml_path):
+    parser = ODXMLParser(xml_path)
+
+    assert list(parser.objects) == ["1000", "1400", "1600", "2000", "6000"]
+    assert list(parser.communication_params) == ["1000", "1400", "1600"]
+    assert list(parser.manufacturer_params) == ["2000"]
+    assert list(parser.device_profile_params) == ["6000"]
+
+    speed = parser.objects["2000"]
+    assert speed["name"] == "Motor speed"
+    assert speed["dataType"] == "0x06"
+    assert parser.objects["1000"]["description"] == "Device profile number"
+    assert [sub["subIndex"] for sub in parser.objects["1600"]["subObjects"]] == ["00", "01", "02"]
+
+
+def test_single_pass_parse_releases_objects_but_keeps_document(xml_path):
+    parser = ODXMLParser(xml_path)
+
+    # Processed objects are dropped from the tree; the 'other' section stays readable
+    assert len(parser.root.find("CANopenObjectList")) == 0
+    device_info = parser.get_device_info()
+    assert device_info["file_info"]["fileName"] == "sample.xml"
+    assert device_info["device_identity"] == {"vendorName": "ACME"}
+
+
+def test_missing_object_list_raises(tmp_path):
+    path = tmp_path / "empty.xml"
+    path.write_text("<device><other /></device>", encoding="utf-8")
+
+    with pytest.raises(Exception, match="No CANopenObjectList"):
+        ODXMLParser(str(path))
+
+
+def test_objects_outside_the_object_list_are_ignored(tmp_path):
+    path = tmp_path / "stray.xml"
+    path.write_text(
+        """<device>
+          <CANopenObjectList>
+            <CANopenObject index="2000" name="Motor speed" />
+          </CANopenObjectList>
+          <other>
+            <CANopenObject index="3000" name="Not in the list" />
+          </other>
+          <CANopenObjectList>
+            <CANopenObject index="4000" name="Second list" />
+          </CANopenObjectList>
+        </device>""",
+        encoding="utf-8"
+    )
+
+    parser = ODXMLParser(str(path))
+
+    # Like root.find('CANopenObjectList'): only the first list's direct children are read
+    assert list(parser.objects) == ["2000"]
+    assert parser.root.find("other/CANopenObject").get("index") == "3000"
+
+
+def test_od_c_lengths_take_priority(xml_path, od_c_path):
+    parser = ODXMLParser(xml_path, od_c_path)
+
+    assert parser.od_c_parser.get_data_length("2000") == 4
+    assert parser.od_c_parser.get_data_length_bits("0x2000") == 32
+    assert parser.get_enhanced_object_info("2000")["od_c_data_length_bits"] == 32
+    assert parser.get_summary()["od_c_summary"]["total_registers"] == 1
+
+
+def test_pdo_objects_captured_during_parse(xml_path):
+    parser = ODXMLParser(xml_path)
+
+    # Only the PDO communication/mapping range (0x1400-0x1BFF), keyed by int index
+    assert sorted(parser._pdo_objects) == [0x1400, 0x1600]
+    assert parser._pdo_objects[0x1600] is parser.objects["1600"]
+
+    rpdo1 = parser.extract_pdo_mappings()["RPDO"]["RPDO1"]
+    assert rpdo1["cob_id"] == "0x00000200"
+    assert rpdo1["transmission_type"] == "254"
+    mapped = [(obj["index"], obj["sub_index"], obj["length_bits"], obj["name"]) for obj in rpdo1["mapped_objects"]]
+    assert mapped == [("2000", "00", 16, "Motor speed"), ("6000", "00", 8, "Digital inputs")]
+    assert parser.extract_pdo_mappings()["TPDO"] == {}
+
+
+def test_summary_cached_until_next_parse(xml_path):
+    parser = ODXMLParser(xml_path)
+
+    summary = parser.get_summary()
+    assert summary["total_objects"] == 5
+    assert summary["manufacturer_params"] == 1
+    assert summary["device_info"]["device_identity"] == {"vendorName": "ACME"}
+    assert parser.get_summary() is summary
+
+    parser.parse_objects()
+    assert parser.get_summary() is not summary
+    assert parser.get_summary() == summary
+
+
+def test_pdo_mappings_cached_until_next_parse(xml_path):
+    parser = ODXMLParser(xml_path)
+
+    mappings = parser.extract_pdo_mappings()
+    assert parser.extract_pdo_mappings() is mappings
+    assert parser.pdo_mappings is mappings
+
+    parser.parse_objects()
+    assert parser.extract_pdo_mappings() is not mappings
+    assert parser.extract_pdo_mappings() == mappings
@@ -0,0 +1,30 @@
+import pytest
+
+from classes.xml_register import XMLRegister
+from utils.od_xml_parser import ODXMLParser
+
+from test_od_xml_parser import SAMPLE_XML
+
+
+def test_register_from_parsed_object(tmp_path):
+    path = tmp_path / "sample.xml"
+    path.write_text(SAMPLE_XML, encoding="utf-8")
+    parser = ODXMLParser(str(path))
+
+    register = XMLRegister("2000", parser.objects["2000"], od_c_length=4)
+
+    assert register.get_full_index() == "2000"
+    assert register.name == "Motor speed"
+    assert register.size == 32  # OD.c length wins over UNSIGNED16
+    assert register.is_writable() and register.is_pdo_mappable()
+    assert register.get_register_dictionary()["2000"]["size_bytes"] == 4
+
+
+def test_register_has_no_instance_dict():
+    register = XMLRegister("6000", {"dataType": "0x05"}, sub_index="01")
+
+    assert not hasattr(register, "__dict__")
+    assert register.get_full_index() == "6000:01"
+    assert register.size == 8
+    with pytest.raises(AttributeError):
+        register.unknown_attribute = 1